@@ -2475,6 +2475,15 @@ Comprehensive analysis of {topic} based on {len(research_results)} research sour
                 self.ai.speak("RDS instances ready")
                 return response
             
+            elif user_input.startswith('aws_overview'):
+                # S3/EC2/Lambda/RDS/CloudFormation in one report: aws_overview [region]
+                parts = user_input[12:].strip().split()
+                region = parts[0] if parts else None
+                
+                response = self.aws.full_status(region)
+                self.ai.speak("AWS overview ready")
+                return response
+            
             elif user_input.startswith('aws_cmd '):
                 # Custom AWS command: aws_cmd service operation param=value
                 parts = user_input[8:].strip().split()
@@ -5,9 +5,82 @@ Manages the step-by-step implementation of all Kiro CLI capabilities
 """
 
 import json
+import mmap
 import os
-from datetime import datetime
+import sys
+import time
+from dataclasses import dataclass, asdict
 from pathlib import Path
+from typing import Optional
+
+STATUS_PENDING = sys.intern("pending")
+STATUS_READY = sys.intern("ready")
+STATUS_IN_PROGRESS = sys.intern("in_progress")
+STATUS_COMPLETED = sys.intern("completed")
+
+# Fixed on-disk widths for the per-tool fields patched in place. JSON allows
+# whitespace after a value, so shorter values are space-padded to the width.
+_STATUS_WIDTH = len('"in_progress"')
+_DATE_WIDTH = len('"YYYY-MM-DDTHH:MM:SS.ffffff"')
+_SLOT_FIELDS = ("status", "start_date", "completion_date")
+_SLOT_WIDTHS = (_STATUS_WIDTH, _DATE_WIDTH, _DATE_WIDTH)
+
+def _now_iso():
+    """Local timestamp in isoformat layout, formatted straight from time_ns"""
+    s, ns = divmod(time.time_ns(), 1_000_000_000)
+    return f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(s))}.{ns // 1000:06d}"
+
+# Initial tracker state, pre-serialized; __START_DATE__ is filled in on first run
+_INITIAL_TRACKER_JSON = (
+    b'{"project_info":{"name":"JARVIS Advanced Autonomous System","start_date":"__START_DATE__","total_tools":18,"completed_tools":0,"current_phase":1,"current_tool":1},'
+    b'"phases":{'
+    b'"1":{"name":"Core Infrastructure","tools":[1,2,3],"status":"in_progress","start_date":null,"completion_date":null},'
+    b'"2":{"name":"Code Intelligence","tools":[4,5,6],"status":"pending","start_date":null,"completion_date":null},'
+    b'"3":{"name":"Web & Research","tools":[7,8,9],"status":"pending","start_date":null,"completion_date":null},'
+    b'"4":{"name":"Knowledge Management","tools":[10,11,12],"status":"pending","start_date":null,"completion_date":null},'
+    b'"5":{"name":"Advanced Automation","tools":[13,14,15],"status":"pending","start_date":null,"completion_date":null},'
+    b'"6":{"name":"AWS & Cloud Integration","tools":[16,17,18],"status":"pending","start_date":null,"completion_date":null}},"tools":{'
+    b'"1":{"status":"ready"      ,"start_date":null                        ,"completion_date":null                        ,"name":"Enhanced File System Manager","phase":1,"priority":"HIGH","estimated_hours":"2-3","dependencies":[],"description":"Advanced file operations with batch processing and pattern matching"},'
+    b'"2":{"status":"pending"    ,"start_date":null                        ,"completion_date":null                        ,"name":"Advanced Search System (grep)","phase":1,"priority":"HIGH","estimated_hours":"2-3","dependencies":[1],"description":"Regex pattern search across files with context-aware results"},'
+    b'"3":{"status":"pending"    ,"start_date":null                        ,"completion_date":null                        ,"name":"Pattern Matching System (glob)","phase":1,"priority":"HIGH","estimated_hours":"1-2","dependencies":[2],"description":"Advanced glob pattern matching for file discovery"},'
+    b'"4":{"status":"pending"    ,"start_date":null                        ,"completion_date":null                        ,"name":"LSP Integration Foundation","phase":2,"priority":"HIGH","estimated_hours":"4-5","dependencies":[1,2,3],"description":"Language Server Protocol client with multi-language support"},'
+    b'"5":{"status":"pending"    ,"start_date":null                        ,"completion_date":null                        ,"name":"Code Intelligence Core","phase":2,"priority":"HIGH","estimated_hours":"3-4","dependencies":[4],"description":"Symbol search, navigation, and code understanding"},'
+    b'"6":{"status":"pending"    ,"start_date":null                        ,"completion_date":null                        ,"name":"Code Operations & Diagnostics","phase":2,"priority":"MEDIUM","estimated_hours":"2-3","dependencies":[5],"description":"Code diagnostics, renaming, and workspace management"},'
+    b'"7":{"status":"pending"    ,"start_date":null                        ,"completion_date":null                        ,"name":"Web Search Integration","phase":3,"priority":"HIGH","estimated_hours":"3-4","dependencies":[4,5,6],"description":"Web search API with result processing and attribution"},'
+    b'"8":{"status":"pending"    ,"start_date":null                        ,"completion_date":null                        ,"name":"Web Content Fetcher","phase":3,"priority":"HIGH","estimated_hours":"2-3","dependencies":[7],"description":"URL content fetching with multiple extraction modes"},'
+    b'"9":{"status":"pending"    ,"start_date":null                        ,"completion_date":null                        ,"name":"Research & Analysis System","phase":3,"priority":"MEDIUM","estimated_hours":"2-3","dependencies":[8],"description":"Automated research workflows and information synthesis"},'
+    b'"10":{"status":"pending"    ,"start_date":null                        ,"completion_date":null                        ,"name":"Knowledge Base Foundation","phase":4,"priority":"HIGH","estimated_hours":"4-5","dependencies":[7,8,9],"description":"Persistent knowledge storage with vector database"},'
+    b'"11":{"status":"pending"    ,"start_date":null                        ,"completion_date":null                        ,"name":"Knowledge Operations","phase":4,"priority":"HIGH","estimated_hours":"3-4","dependencies":[10],"description":"Knowledge CRUD operations and management"},'
+    b'"12":{"status":"pending"    ,"start_date":null                        ,"completion_date":null                        ,"name":"Semantic Search & Analysis","phase":4,"priority":"MEDIUM","estimated_hours":"2-3","dependencies":[11],"description":"Advanced semantic search and knowledge analytics"},'
+    b'"13":{"status":"pending"    ,"start_date":null                        ,"completion_date":null                        ,"name":"Subagent System Foundation","phase":5,"priority":"HIGH","estimated_hours":"4-5","dependencies":[10,11,12],"description":"Subagent creation and parallel task execution"},'
+    b'"14":{"status":"pending"    ,"start_date":null                        ,"completion_date":null                        ,"name":"Task Management System","phase":5,"priority":"HIGH","estimated_hours":"3-4","dependencies":[13],"description":"TODO list management and task tracking"},'
+    b'"15":{"status":"pending"    ,"start_date":null                        ,"completion_date":null                        ,"name":"Workflow Automation Engine","phase":5,"priority":"MEDIUM","estimated_hours":"3-4","dependencies":[14],"description":"Advanced workflow creation and automation"},'
+    b'"16":{"status":"pending"    ,"start_date":null                        ,"completion_date":null                        ,"name":"AWS CLI Integration","phase":6,"priority":"HIGH","estimated_hours":"3-4","dependencies":[13,14,15],"description":"AWS CLI command execution and resource management"},'
+    b'"17":{"status":"pending"    ,"start_date":null                        ,"completion_date":null                        ,"name":"Infrastructure Management","phase":6,"priority":"MEDIUM","estimated_hours":"2-3","dependencies":[16],"description":"Infrastructure as Code and resource provisioning"},'
+    b'"18":{"status":"pending"    ,"start_date":null                        ,"completion_date":null                        ,"name":"Security & Compliance","phase":6,"priority":"MEDIUM","estimated_hours":"2-3","dependencies":[17],"description":"Security scanning and compliance checking"}}}'
+)
+
+@dataclass(slots=True)
+class Tool:
+    """A single tool entry in the implementation roadmap"""
+    name: str
+    phase: int
+    priority: str
+    estimated_hours: str
+    status: str
+    start_date: Optional[str]
+    completion_date: Optional[str]
+    dependencies: tuple
+    description: str
+
+@dataclass(slots=True)
+class Phase:
+    """A group of tools implemented together"""
+    name: str
+    tools: tuple
+    status: str
+    start_date: Optional[str]
+    completion_date: Optional[str]
 
 class JARVISImplementationTracker:
     def __init__(self):
@@ -16,292 +89,131 @@ class JARVISImplementationTracker:
     
     def load_progress(self):
         """Load implementation progress from file"""
-        if self.tracker_file.exists():
-            with open(self.tracker_file, 'r') as f:
-                self.data = json.load(f)
-        else:
-            self.data = self.create_initial_tracker()
-            self.save_progress()
+        self._mm = None
+        try:
+            with open(self.tracker_file, 'rb') as f:
+                raw = f.read()
+        except FileNotFoundError:
+            raw = self.create_initial_tracker()
+            self.tracker_file.write_bytes(raw)
+        self.data = json.loads(raw)
+        
+        # Tools and phases are kept as slotted records, indexed by id - 1
+        self.tools = [
+            Tool(**{**tool, "status": sys.intern(tool["status"]),
+                    "dependencies": tuple(tool["dependencies"])})
+            for _, tool in sorted(self.data.pop("tools").items(), key=lambda item: int(item[0]))
+        ]
+        self.phases = [
+            Phase(**{**phase, "status": sys.intern(phase["status"]),
+                     "tools": tuple(phase["tools"])})
+            for _, phase in sorted(self.data.pop("phases").items(), key=lambda item: int(item[0]))
+        ]
+        
+        # Phase -> tool membership, built once for phase transition checks
+        self._phase_tool_sets = {
+            phase_id: frozenset(phase.tools)
+            for phase_id, phase in enumerate(self.phases, 1)
+        }
+        
+        # Files in an older layout are rewritten once so status slots can be patched
+        payload = self._serialize()
+        if payload != raw:
+            self.tracker_file.write_bytes(payload)
+        self._map_file()
     
     def create_initial_tracker(self):
-        """Create initial tracker with all 18 tools"""
+        """Create initial tracker with all 18 tools, as serialized JSON bytes"""
+        start_date = json.dumps(_now_iso()).encode()
+        return _INITIAL_TRACKER_JSON.replace(b'"__START_DATE__"', start_date)
+    
+    def to_dict(self):
+        """Serialize tracker state back to its JSON layout"""
         return {
-            "project_info": {
-                "name": "JARVIS Advanced Autonomous System",
-                "start_date": datetime.now().isoformat(),
-                "total_tools": 18,
-                "completed_tools": 0,
-                "current_phase": 1,
-                "current_tool": 1
-            },
-            "phases": {
-                "1": {
-                    "name": "Core Infrastructure",
-                    "tools": [1, 2, 3],
-                    "status": "in_progress",
-                    "start_date": None,
-                    "completion_date": None
-                },
-                "2": {
-                    "name": "Code Intelligence", 
-                    "tools": [4, 5, 6],
-                    "status": "pending",
-                    "start_date": None,
-                    "completion_date": None
-                },
-                "3": {
-                    "name": "Web & Research",
-                    "tools": [7, 8, 9], 
-                    "status": "pending",
-                    "start_date": None,
-                    "completion_date": None
-                },
-                "4": {
-                    "name": "Knowledge Management",
-                    "tools": [10, 11, 12],
-                    "status": "pending", 
-                    "start_date": None,
-                    "completion_date": None
-                },
-                "5": {
-                    "name": "Advanced Automation",
-                    "tools": [13, 14, 15],
-                    "status": "pending",
-                    "start_date": None, 
-                    "completion_date": None
-                },
-                "6": {
-                    "name": "AWS & Cloud Integration",
-                    "tools": [16, 17, 18],
-                    "status": "pending",
-                    "start_date": None,
-                    "completion_date": None
-                }
-            },
-            "tools": {
-                "1": {
-                    "name": "Enhanced File System Manager",
-                    "phase": 1,
-                    "priority": "HIGH",
-                    "estimated_hours": "2-3",
-                    "status": "ready",
-                    "start_date": None,
-                    "completion_date": None,
-                    "dependencies": [],
-                    "description": "Advanced file operations with batch processing and pattern matching"
-                },
-                "2": {
-                    "name": "Advanced Search System (grep)",
-                    "phase": 1,
-                    "priority": "HIGH", 
-                    "estimated_hours": "2-3",
-                    "status": "pending",
-                    "start_date": None,
-                    "completion_date": None,
-                    "dependencies": [1],
-                    "description": "Regex pattern search across files with context-aware results"
-                },
-                "3": {
-                    "name": "Pattern Matching System (glob)",
-                    "phase": 1,
-                    "priority": "HIGH",
-                    "estimated_hours": "1-2", 
-                    "status": "pending",
-                    "start_date": None,
-                    "completion_date": None,
-                    "dependencies": [2],
-                    "description": "Advanced glob pattern matching for file discovery"
-                },
-                "4": {
-                    "name": "LSP Integration Foundation",
-                    "phase": 2,
-                    "priority": "HIGH",
-                    "estimated_hours": "4-5",
-                    "status": "pending",
-                    "start_date": None,
-                    "completion_date": None, 
-                    "dependencies": [1, 2, 3],
-                    "description": "Language Server Protocol client with multi-language support"
-                },
-                "5": {
-                    "name": "Code Intelligence Core", 
-                    "phase": 2,
-                    "priority": "HIGH",
-                    "estimated_hours": "3-4",
-                    "status": "pending",
-                    "start_date": None,
-                    "completion_date": None,
-                    "dependencies": [4],
-                    "description": "Symbol search, navigation, and code understanding"
-                },
-                "6": {
-                    "name": "Code Operations & Diagnostics",
-                    "phase": 2,
-                    "priority": "MEDIUM",
-                    "estimated_hours": "2-3",
-                    "status": "pending", 
-                    "start_date": None,
-                    "completion_date": None,
-                    "dependencies": [5],
-                    "description": "Code diagnostics, renaming, and workspace management"
-                },
-                "7": {
-                    "name": "Web Search Integration",
-                    "phase": 3,
-                    "priority": "HIGH",
-                    "estimated_hours": "3-4",
-                    "status": "pending",
-                    "start_date": None,
-                    "completion_date": None,
-                    "dependencies": [4, 5, 6],
-                    "description": "Web search API with result processing and attribution"
-                },
-                "8": {
-                    "name": "Web Content Fetcher",
-                    "phase": 3, 
-                    "priority": "HIGH",
-                    "estimated_hours": "2-3",
-                    "status": "pending",
-                    "start_date": None,
-                    "completion_date": None,
-                    "dependencies": [7],
-                    "description": "URL content fetching with multiple extraction modes"
-                },
-                "9": {
-                    "name": "Research & Analysis System",
-                    "phase": 3,
-                    "priority": "MEDIUM",
-                    "estimated_hours": "2-3",
-                    "status": "pending",
-                    "start_date": None,
-                    "completion_date": None,
-                    "dependencies": [8],
-                    "description": "Automated research workflows and information synthesis"
-                },
-                "10": {
-                    "name": "Knowledge Base Foundation",
-                    "phase": 4,
-                    "priority": "HIGH", 
-                    "estimated_hours": "4-5",
-                    "status": "pending",
-                    "start_date": None,
-                    "completion_date": None,
-                    "dependencies": [7, 8, 9],
-                    "description": "Persistent knowledge storage with vector database"
-                },
-                "11": {
-                    "name": "Knowledge Operations",
-                    "phase": 4,
-                    "priority": "HIGH",
-                    "estimated_hours": "3-4",
-                    "status": "pending",
-                    "start_date": None,
-                    "completion_date": None,
-                    "dependencies": [10],
-                    "description": "Knowledge CRUD operations and management"
-                },
-                "12": {
-                    "name": "Semantic Search & Analysis",
-                    "phase": 4,
-                    "priority": "MEDIUM",
-                    "estimated_hours": "2-3",
-                    "status": "pending",
-                    "start_date": None,
-                    "completion_date": None,
-                    "dependencies": [11],
-                    "description": "Advanced semantic search and knowledge analytics"
-                },
-                "13": {
-                    "name": "Subagent System Foundation",
-                    "phase": 5,
-                    "priority": "HIGH",
-                    "estimated_hours": "4-5",
-                    "status": "pending",
-                    "start_date": None,
-                    "completion_date": None,
-                    "dependencies": [10, 11, 12],
-                    "description": "Subagent creation and parallel task execution"
-                },
-                "14": {
-                    "name": "Task Management System",
-                    "phase": 5,
-                    "priority": "HIGH",
-                    "estimated_hours": "3-4",
-                    "status": "pending",
-                    "start_date": None,
-                    "completion_date": None,
-                    "dependencies": [13],
-                    "description": "TODO list management and task tracking"
-                },
-                "15": {
-                    "name": "Workflow Automation Engine",
-                    "phase": 5,
-                    "priority": "MEDIUM",
-                    "estimated_hours": "3-4",
-                    "status": "pending",
-                    "start_date": None,
-                    "completion_date": None,
-                    "dependencies": [14],
-                    "description": "Advanced workflow creation and automation"
-                },
-                "16": {
-                    "name": "AWS CLI Integration",
-                    "phase": 6,
-                    "priority": "HIGH",
-                    "estimated_hours": "3-4",
-                    "status": "pending",
-                    "start_date": None,
-                    "completion_date": None,
-                    "dependencies": [13, 14, 15],
-                    "description": "AWS CLI command execution and resource management"
-                },
-                "17": {
-                    "name": "Infrastructure Management",
-                    "phase": 6,
-                    "priority": "MEDIUM",
-                    "estimated_hours": "2-3",
-                    "status": "pending",
-                    "start_date": None,
-                    "completion_date": None,
-                    "dependencies": [16],
-                    "description": "Infrastructure as Code and resource provisioning"
-                },
-                "18": {
-                    "name": "Security & Compliance",
-                    "phase": 6,
-                    "priority": "MEDIUM",
-                    "estimated_hours": "2-3",
-                    "status": "pending",
-                    "start_date": None,
-                    "completion_date": None,
-                    "dependencies": [17],
-                    "description": "Security scanning and compliance checking"
-                }
-            }
+            "project_info": self.data["project_info"],
+            "phases": {str(i): asdict(phase) for i, phase in enumerate(self.phases, 1)},
+            "tools": {str(i): asdict(tool) for i, tool in enumerate(self.tools, 1)}
         }
     
+    def _serialize(self):
+        """Serialize compactly, recording byte offsets of each tool's padded slots"""
+        dumps = lambda obj: json.dumps(obj, separators=(',', ':'))
+        parts = [
+            '{"project_info":', dumps(self.data["project_info"]),
+            ',"phases":', dumps({str(i): asdict(phase) for i, phase in enumerate(self.phases, 1)}),
+            ',"tools":{'
+        ]
+        offset = sum(map(len, parts))
+        self._slots = []
+        for i, tool in enumerate(self.tools, 1):
+            record = asdict(tool)
+            prefix = f'{"," if i > 1 else ""}"{i}":{{'
+            parts.append(prefix)
+            offset += len(prefix)
+            offsets = []
+            for field, width in zip(_SLOT_FIELDS, _SLOT_WIDTHS):
+                key = f'"{field}":'
+                slot = dumps(record.pop(field)).ljust(width)
+                parts.append(key)
+                parts.append(slot)
+                parts.append(',')
+                offsets.append(offset + len(key))
+                offset += len(key) + len(slot) + 1
+            rest = dumps(record)[1:]
+            parts.append(rest)
+            offset += len(rest)
+            self._slots.append(tuple(offsets))
+        parts.append('}}')
+        return ''.join(parts).encode('ascii')
+    
+    def _map_file(self):
+        """Map the tracker file read-write for in-place slot updates"""
+        with open(self.tracker_file, 'r+b') as f:
+            self._mm = mmap.mmap(f.fileno(), 0)
+    
+    def _patch_tool(self, index):
+        """Patch a tool's status/date slots in place; False if a value does not fit"""
+        tool = self.tools[index]
+        values = [json.dumps(getattr(tool, field)).encode() for field in _SLOT_FIELDS]
+        if self._mm is None or any(len(v) > w for v, w in zip(values, _SLOT_WIDTHS)):
+            return False
+        offsets = self._slots[index]
+        for offset, value, width in zip(offsets, values, _SLOT_WIDTHS):
+            self._mm[offset:offset + width] = value.ljust(width)
+        start = offsets[0] & ~(mmap.PAGESIZE - 1)
+        self._mm.flush(start, offsets[-1] + _DATE_WIDTH - start)
+        return True
+    
     def save_progress(self):
-        """Save progress to file"""
-        with open(self.tracker_file, 'w') as f:
-            json.dump(self.data, f, indent=2)
+        """Save progress to file (compact - the tracker file is machine-read)"""
+        payload = self._serialize()
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        self.tracker_file.write_bytes(payload)
+        self._map_file()
+    
+    def show_json(self):
+        """Pretty-print the raw tracker data for human inspection"""
+        print(json.dumps(self.to_dict(), indent=2))
     
     def get_current_tool(self):
         """Get the current tool to work on"""
-        current_tool_id = str(self.data["project_info"]["current_tool"])
-        return self.data["tools"][current_tool_id]
+        return self.tools[self.data["project_info"]["current_tool"] - 1]
     
     def start_tool(self, tool_id):
         """Mark a tool as started"""
-        tool_id = str(tool_id)
-        self.data["tools"][tool_id]["status"] = "in_progress"
-        self.data["tools"][tool_id]["start_date"] = datetime.now().isoformat()
-        self.save_progress()
+        tool = self.tools[int(tool_id) - 1]
+        tool.status = STATUS_IN_PROGRESS
+        tool.start_date = _now_iso()
+        if not self._patch_tool(int(tool_id) - 1):
+            self.save_progress()
     
     def complete_tool(self, tool_id):
         """Mark a tool as completed and move to next"""
-        tool_id = str(tool_id)
-        self.data["tools"][tool_id]["status"] = "completed"
-        self.data["tools"][tool_id]["completion_date"] = datetime.now().isoformat()
+        tool = self.tools[int(tool_id) - 1]
+        tool.status = STATUS_COMPLETED
+        tool.completion_date = _now_iso()
         
         # Update project progress
         self.data["project_info"]["completed_tools"] += 1
@@ -313,17 +225,19 @@ class JARVISImplementationTracker:
             
             # Check if we need to move to next phase
             current_phase = self.data["project_info"]["current_phase"]
-            if next_tool_id not in self.data["phases"][str(current_phase)]["tools"]:
+            if next_tool_id not in self._phase_tool_sets[current_phase]:
                 # Complete current phase
-                self.data["phases"][str(current_phase)]["status"] = "completed"
-                self.data["phases"][str(current_phase)]["completion_date"] = datetime.now().isoformat()
+                phase = self.phases[current_phase - 1]
+                phase.status = STATUS_COMPLETED
+                phase.completion_date = _now_iso()
                 
                 # Start next phase
                 next_phase = current_phase + 1
                 if next_phase <= 6:
                     self.data["project_info"]["current_phase"] = next_phase
-                    self.data["phases"][str(next_phase)]["status"] = "in_progress"
-                    self.data["phases"][str(next_phase)]["start_date"] = datetime.now().isoformat()
+                    phase = self.phases[next_phase - 1]
+                    phase.status = STATUS_IN_PROGRESS
+                    phase.start_date = _now_iso()
         
         self.save_progress()
     
@@ -336,44 +250,44 @@ class JARVISImplementationTracker:
         print(f"=" * 50)
         print(f"📊 Progress: {info['completed_tools']}/{info['total_tools']} tools completed")
         print(f"📈 Completion: {(info['completed_tools']/info['total_tools']*100):.1f}%")
-        print(f"🎯 Current Phase: {info['current_phase']} - {self.data['phases'][str(info['current_phase'])]['name']}")
-        print(f"🔧 Current Tool: {info['current_tool']} - {current_tool['name']}")
-        print(f"⏱️ Estimated Time: {current_tool['estimated_hours']} hours")
-        print(f"🎯 Priority: {current_tool['priority']}")
-        print(f"📝 Description: {current_tool['description']}")
+        print(f"🎯 Current Phase: {info['current_phase']} - {self.phases[info['current_phase'] - 1].name}")
+        print(f"🔧 Current Tool: {info['current_tool']} - {current_tool.name}")
+        print(f"⏱️ Estimated Time: {current_tool.estimated_hours} hours")
+        print(f"🎯 Priority: {current_tool.priority}")
+        print(f"📝 Description: {current_tool.description}")
         
         # Show dependencies
-        if current_tool['dependencies']:
-            print(f"📋 Dependencies: {', '.join(map(str, current_tool['dependencies']))}")
+        if current_tool.dependencies:
+            print(f"📋 Dependencies: {', '.join(map(str, current_tool.dependencies))}")
         else:
             print(f"📋 Dependencies: None - Ready to start!")
         
-        print(f"\n🚀 Next Action: Implement {current_tool['name']}")
+        print(f"\n🚀 Next Action: Implement {current_tool.name}")
     
     def show_roadmap(self):
         """Display full roadmap with status"""
         print(f"\n🗺️ JARVIS Implementation Roadmap")
         print(f"=" * 60)
         
-        for phase_id, phase in self.data["phases"].items():
+        for phase_id, phase in enumerate(self.phases, 1):
             status_icon = {
-                "completed": "✅",
-                "in_progress": "🔄", 
-                "pending": "⏳"
-            }.get(phase["status"], "❓")
+                STATUS_COMPLETED: "✅",
+                STATUS_IN_PROGRESS: "🔄",
+                STATUS_PENDING: "⏳"
+            }.get(phase.status, "❓")
             
-            print(f"\n{status_icon} Phase {phase_id}: {phase['name']}")
+            print(f"\n{status_icon} Phase {phase_id}: {phase.name}")
             
-            for tool_id in phase["tools"]:
-                tool = self.data["tools"][str(tool_id)]
+            for tool_id in phase.tools:
+                tool = self.tools[tool_id - 1]
                 tool_status_icon = {
-                    "completed": "✅",
-                    "in_progress": "🔄",
-                    "ready": "🟢", 
-                    "pending": "⏳"
-                }.get(tool["status"], "❓")
+                    STATUS_COMPLETED: "✅",
+                    STATUS_IN_PROGRESS: "🔄",
+                    STATUS_READY: "🟢",
+                    STATUS_PENDING: "⏳"
+                }.get(tool.status, "❓")
                 
-                print(f"   {tool_status_icon} Tool {tool_id}: {tool['name']} ({tool['priority']})")
+                print(f"   {tool_status_icon} Tool {tool_id}: {tool.name} ({tool.priority})")
 
 def main():
     """Main function to manage JARVIS implementation"""
@@ -388,9 +302,10 @@ def main():
         print("2. Show full roadmap") 
         print("3. Start current tool")
         print("4. Complete current tool")
-        print("5. Exit")
+        print("5. Show raw tracker JSON")
+        print("6. Exit")
         
-        choice = input("\nEnter choice (1-5): ").strip()
+        choice = input("\nEnter choice (1-6): ").strip()
         
         if choice == "1":
             tracker.show_status()
@@ -405,6 +320,8 @@ def main():
             tracker.complete_tool(current_tool_id)
             print(f"✅ Completed Tool {current_tool_id}")
         elif choice == "5":
+            tracker.show_json()
+        elif choice == "6":
             print("👋 Goodbye!")
             break
         else:
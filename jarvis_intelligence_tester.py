@@ -4,23 +4,90 @@ JARVIS Intelligence Testing Workflow
 Systematic testing of all 20 tools with complex, real-world scenarios
 """
 
+import os
+import re
+import sys
 import json
 import time
+import queue
+import argparse
+import uuid
+import threading
 import subprocess
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 class JARVISIntelligenceTester:
+    # Per-test timeout for the persistent JARVIS REPL
+    TEST_TIMEOUT = 120
+    
+    # Output keywords used to score a test run
+    INTELLIGENCE_INDICATORS = [
+        "analyzing", "processing", "reasoning", "thinking",
+        "completed", "generated", "created", "implemented",
+        "optimized", "identified", "suggested", "recommended"
+    ]
+    PROBLEM_SOLVING_INDICATORS = [
+        "solution", "approach", "strategy", "method",
+        "workflow", "process", "steps", "plan"
+    ]
+    ERROR_INDICATORS = ["error", "failed", "cannot", "unable"]
+    
+    # Start with the most critical tools first
+    PRIORITY_ORDER = (4, 8, 9, 10, 12, 13, 14, 15, 16, 7, 1, 2, 6, 11, 17, 18, 19, 20, 3, 5)
+    
+    # Ordered (tag, name keywords) rules picking a command template per tool
+    COMMAND_DISPATCH_RULES = (
+        ("file", ("file",)),
+        ("search", ("search",)),
+        ("web", ("web",)),
+        ("code", ("code",)),
+        ("cloud", ("aws", "infrastructure")),
+        ("security", ("security",))
+    )
+    
+    # Natural language command templates without hints, keyed by dispatch tag
+    COMMAND_TEMPLATES = {
+        "file": "I need you to {scenario}. Please complete this task autonomously.",
+        "search": "Please {scenario}. Use your search capabilities to complete this comprehensively.",
+        "web": "Research task: {scenario}. Provide detailed analysis.",
+        "code": "Code analysis task: {scenario}. Show your reasoning.",
+        "cloud": "Cloud architecture task: {scenario}. Design and explain your approach.",
+        "security": "Security assessment: {scenario}. Provide comprehensive analysis.",
+        "default": "Complex task: {scenario}. Complete this using your best capabilities."
+    }
+    
     def __init__(self):
+        self._jarvis_proc = None
+        
+        # Output is tokenized into words once per line and scored by set intersection
+        self._word_re = re.compile(r'[a-z]+', re.IGNORECASE)
+        
+        # (category, indicator words, count at which the category's outcome is decided)
+        self._indicator_scans = (
+            ("intelligence", frozenset(self.INTELLIGENCE_INDICATORS), 2),
+            ("problem_solving", frozenset(self.PROBLEM_SOLVING_INDICATORS), 1),
+            ("errors", frozenset(self.ERROR_INDICATORS), 2)
+        )
         self.test_results = {
             "session_id": f"test_{int(time.time())}",
             "start_time": datetime.now().isoformat(),
             "tools_tested": 0,
             "tools_passed": 0,
-            "tools_failed": 0,
-            "test_details": {}
+            "tools_failed": 0
         }
         
+        # Per-test records are streamed here as JSON Lines instead of held in memory
+        self.details_file = f"JARVIS_Intelligence_Test_Report_{self.test_results['session_id']}.jsonl"
+        self._details_stream = None
+        
         # Define all 20 JARVIS tools with complex test scenarios
         self.tools_to_test = {
             1: {
@@ -164,36 +231,92 @@ class JARVISIntelligenceTester:
                 "skills_tested": ["performance_analysis", "optimization", "automation"]
             }
         }
+        
+        # Column views of the static tool table, with the command dispatch resolved once
+        self._names = {tool_id: tool["name"] for tool_id, tool in self.tools_to_test.items()}
+        self._scenarios = {tool_id: tool["test_scenario"].lower() for tool_id, tool in self.tools_to_test.items()}
+        self._complexities = {tool_id: tool["complexity"] for tool_id, tool in self.tools_to_test.items()}
+        self._dispatch_tag = {tool_id: self._resolve_dispatch_tag(name) for tool_id, name in self._names.items()}
+        
+        # Test traversal in priority order, resolved once
+        self._ordered_tests = tuple(
+            (tool_id, self.tools_to_test[tool_id])
+            for tool_id in self.PRIORITY_ORDER if tool_id in self.tools_to_test
+        )
     
-    def run_comprehensive_test(self):
-        """Run comprehensive intelligence testing workflow"""
+    def __getstate__(self):
+        """Worker processes receive the test tables, not this process's open handles"""
+        state = self.__dict__.copy()
+        state["_details_stream"] = None
+        state["_jarvis_proc"] = None
+        return state
+    
+    def run_comprehensive_test(self, batch_size=3, max_workers=None):
+        """Run comprehensive intelligence testing workflow
+        
+        Tests are split into batches of batch_size tools; each batch shares one
+        JARVIS REPL and batches run in parallel worker processes.
+        """
         print("🧪 JARVIS Intelligence Testing Framework")
         print("=" * 50)
         print(f"📊 Testing {len(self.tools_to_test)} tools with complex scenarios")
         print(f"🎯 Objective: Achieve enterprise-level AI agent capabilities")
         print()
         
-        # Start with the most critical tools first
-        priority_order = [4, 8, 9, 10, 12, 13, 14, 15, 16, 7, 1, 2, 6, 11, 17, 18, 19, 20, 3, 5]
+        ordered = self._ordered_tests
+        batches = [ordered[i:i + batch_size] for i in range(0, len(ordered), batch_size)]
         
-        for tool_id in priority_order:
-            if tool_id in self.tools_to_test:
-                self.test_tool(tool_id)
-                print()
+        if max_workers is None:
+            max_workers = min(os.cpu_count() or 1, 8)
+        max_workers = max(max_workers, 1)
+        
+        # Results are merged here in the parent as batches finish
+        with open(self.details_file, 'ab') as self._details_stream, \
+                ProcessPoolExecutor(max_workers=min(max_workers, len(batches))) as executor:
+            futures = [executor.submit(self.test_batch, batch) for batch in batches]
+            for future in as_completed(futures):
+                for outcome in future.result():
+                    self.merge_test_result(outcome)
+        self._details_stream = None
         
         self.generate_final_report()
     
-    def test_tool(self, tool_id):
-        """Test individual tool with complex scenario"""
-        tool = self.tools_to_test[tool_id]
-        print(f"🔧 Testing Tool {tool_id}: {tool['name']}")
+    def test_batch(self, tests):
+        """Test a batch of (tool_id, tool) pairs against a single JARVIS REPL (runs in a worker process)"""
+        try:
+            outcomes = []
+            for tool_id, tool in tests:
+                outcomes.append(self.test_tool(tool_id, tool))
+                print()
+            return outcomes
+        finally:
+            self.stop_jarvis()
+    
+    def merge_test_result(self, outcome):
+        """Fold a single test outcome into the session counters and stream its record"""
+        record = {"tool_id": outcome["tool_id"], **outcome["details"]}
+        if ORJSON_AVAILABLE:
+            self._details_stream.write(orjson.dumps(record) + b"\n")
+        else:
+            self._details_stream.write(json.dumps(record).encode() + b"\n")
+        self._details_stream.flush()
+        
+        if outcome["details"]["success"]:
+            self.test_results["tools_passed"] += 1
+        else:
+            self.test_results["tools_failed"] += 1
+        self.test_results["tools_tested"] += 1
+    
+    def test_tool(self, tool_id, tool):
+        """Test individual tool with complex scenario and return its outcome"""
+        print(f"🔧 Testing Tool {tool_id}: {self._names[tool_id]}")
         print(f"📝 Scenario: {tool['test_scenario']}")
-        print(f"🎯 Complexity: {tool['complexity']}")
+        print(f"🎯 Complexity: {self._complexities[tool_id]}")
         print(f"🧠 Skills: {', '.join(tool['skills_tested'])}")
         print()
         
         # Create test command for JARVIS
-        test_command = self.create_test_command(tool)
+        test_command = self.create_test_command(tool_id)
         
         print(f"🚀 Executing test...")
         print(f"💬 Command: {test_command}")
@@ -205,127 +328,185 @@ class JARVISIntelligenceTester:
         # Analyze results
         success = self.analyze_test_result(tool_id, result)
         
-        # Record results
-        self.record_test_result(tool_id, tool, result, success)
-        
         if success:
             print(f"✅ Tool {tool_id} ({tool['name']}) - PASSED")
-            self.test_results["tools_passed"] += 1
         else:
             print(f"❌ Tool {tool_id} ({tool['name']}) - FAILED")
             print(f"🔍 Analysis needed for improvement")
-            self.test_results["tools_failed"] += 1
         
-        self.test_results["tools_tested"] += 1
+        return {
+            "tool_id": tool_id,
+            "details": self.record_test_result(tool_id, tool, result, success)
+        }
+    
+    def _resolve_dispatch_tag(self, name):
+        """Pick the command template tag for a tool name"""
+        name = name.lower()
+        for tag, keywords in self.COMMAND_DISPATCH_RULES:
+            if any(keyword in name for keyword in keywords):
+                return tag
+        return "default"
     
-    def create_test_command(self, tool):
+    def create_test_command(self, tool_id):
         """Create appropriate test command based on tool type"""
-        scenario = tool['test_scenario']
+        template = self.COMMAND_TEMPLATES[self._dispatch_tag[tool_id]]
+        return template.format(scenario=self._scenarios[tool_id])
+    
+    def start_jarvis(self):
+        """Start one long-lived JARVIS REPL that all test commands are streamed into"""
+        # An absolute interpreter path, no cwd and close_fds=False let subprocess
+        # use posix_spawn instead of fork+exec; our own fds are non-inheritable anyway
+        self._jarvis_proc = subprocess.Popen(
+            [sys.executable, '-u', 'jarvis_unified_cli.py'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=1,
+            text=True,
+            close_fds=False
+        )
         
-        # Create natural language command without hints
-        if "file" in tool['name'].lower():
-            return f"I need you to {scenario.lower()}. Please complete this task autonomously."
-        elif "search" in tool['name'].lower():
-            return f"Please {scenario.lower()}. Use your search capabilities to complete this comprehensively."
-        elif "web" in tool['name'].lower():
-            return f"Research task: {scenario.lower()}. Provide detailed analysis."
-        elif "code" in tool['name'].lower():
-            return f"Code analysis task: {scenario.lower()}. Show your reasoning."
-        elif "aws" in tool['name'].lower() or "infrastructure" in tool['name'].lower():
-            return f"Cloud architecture task: {scenario.lower()}. Design and explain your approach."
-        elif "security" in tool['name'].lower():
-            return f"Security assessment: {scenario.lower()}. Provide comprehensive analysis."
-        else:
-            return f"Complex task: {scenario.lower()}. Complete this using your best capabilities."
+        # Reader threads keep the pipes drained so a per-test timeout can be enforced
+        self._stdout_lines = queue.Queue()
+        self._stderr_lines = queue.Queue()
+        for stream, lines in ((self._jarvis_proc.stdout, self._stdout_lines),
+                              (self._jarvis_proc.stderr, self._stderr_lines)):
+            threading.Thread(target=self._pump_stream, args=(stream, lines), daemon=True).start()
+    
+    @staticmethod
+    def _pump_stream(stream, lines):
+        """Forward lines from a child pipe into a queue; None marks EOF"""
+        for line in stream:
+            lines.put(line)
+        lines.put(None)
+    
+    def _drain_stderr(self):
+        """Collect whatever the REPL has written to stderr so far"""
+        chunks = []
+        while True:
+            try:
+                line = self._stderr_lines.get_nowait()
+            except queue.Empty:
+                break
+            if line is not None:
+                chunks.append(line)
+        return "".join(chunks)
+    
+    def stop_jarvis(self, force=False):
+        """Shut down the persistent JARVIS REPL (kill it outright if force)"""
+        proc, self._jarvis_proc = self._jarvis_proc, None
+        if proc is None:
+            return
+        try:
+            if force:
+                proc.kill()
+            elif proc.poll() is None:
+                proc.stdin.write("exit\n")
+                proc.stdin.flush()
+            proc.wait(timeout=10)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+            proc.wait()
     
     def execute_jarvis_test(self, command):
-        """Execute test command with JARVIS"""
+        """Execute test command with the persistent JARVIS REPL"""
+        start = time.time()
         try:
-            # Run JARVIS with the test command
-            cmd = [
-                'python', 'jarvis_unified_cli.py'
-            ]
+            if self._jarvis_proc is None or self._jarvis_proc.poll() is not None:
+                self.start_jarvis()
             
-            # Create input with command and exit
-            test_input = f"{command}\nexit\n"
+            # The sentinel is echoed back through shell mode once the command is done
+            sentinel = f"JARVIS_END_OF_TEST_{uuid.uuid4().hex}"
+            self._jarvis_proc.stdin.write(f"{command}\n$ echo {sentinel}\n")
+            self._jarvis_proc.stdin.flush()
             
-            result = subprocess.run(
-                cmd,
-                input=test_input,
-                text=True,
-                capture_output=True,
-                timeout=120,  # 2 minute timeout
-                cwd=Path.cwd()
-            )
+            # Output is scored and counted line by line, then discarded
+            indicators = {category: set() for category, _, _ in self._indicator_scans}
+            output_length = 0
+            deadline = start + self.TEST_TIMEOUT
+            while True:
+                line = self._stdout_lines.get(timeout=max(deadline - time.time(), 0))
+                if line is None:
+                    self._jarvis_proc.wait()
+                    return {
+                        "success": False,
+                        "stderr": self._drain_stderr() or "JARVIS exited before completing the test",
+                        "indicators": indicators,
+                        "output_length": output_length,
+                        "execution_time": time.time() - start
+                    }
+                if sentinel in line:
+                    break
+                
+                self.scan_output_line(line, indicators)
+                output_length += len(line)
             
             return {
-                "success": result.returncode == 0,
-                "stdout": result.stdout,
-                "stderr": result.stderr,
-                "execution_time": time.time()
+                "success": True,
+                "stderr": self._drain_stderr(),
+                "indicators": indicators,
+                "output_length": output_length,
+                "execution_time": time.time() - start
             }
             
-        except subprocess.TimeoutExpired:
+        except queue.Empty:
+            # A hung REPL can't be reused - restart it for the next test
+            self.stop_jarvis(force=True)
             return {
                 "success": False,
-                "stdout": "",
                 "stderr": "Test timed out after 2 minutes",
-                "execution_time": 120
+                "execution_time": self.TEST_TIMEOUT
             }
         except Exception as e:
+            self.stop_jarvis(force=True)
             return {
                 "success": False,
-                "stdout": "",
                 "stderr": f"Test execution error: {str(e)}",
                 "execution_time": 0
             }
     
+    def scan_output_line(self, line, indicators):
+        """Add indicators found in one output line; categories already decided are skipped"""
+        if len(indicators["errors"]) >= 2:
+            return  # Test has already failed
+        tokens = {word.lower() for word in self._word_re.findall(line)}
+        for category, words, decided_at in self._indicator_scans:
+            found = indicators[category]
+            if len(found) < decided_at:
+                found |= words & tokens
+    
     def analyze_test_result(self, tool_id, result):
         """Analyze test result for intelligence and capability"""
         if not result["success"]:
             return False
         
-        output = result["stdout"].lower()
+        indicators = result["indicators"]
         
-        # Check for intelligence indicators
-        intelligence_indicators = [
-            "analyzing", "processing", "reasoning", "thinking",
-            "completed", "generated", "created", "implemented",
-            "optimized", "identified", "suggested", "recommended"
-        ]
-        
-        # Check for problem-solving indicators
-        problem_solving_indicators = [
-            "solution", "approach", "strategy", "method",
-            "workflow", "process", "steps", "plan"
-        ]
-        
-        # Check for error handling
-        error_indicators = ["error", "failed", "cannot", "unable"]
-        
-        intelligence_score = sum(1 for indicator in intelligence_indicators if indicator in output)
-        problem_solving_score = sum(1 for indicator in problem_solving_indicators if indicator in output)
-        error_count = sum(1 for indicator in error_indicators if indicator in output)
+        # Score counts distinct indicators present (intelligence, problem-solving, errors)
+        intelligence_score = len(indicators["intelligence"])
+        problem_solving_score = len(indicators["problem_solving"])
+        error_count = len(indicators["errors"])
         
         # Success criteria: High intelligence + problem solving, low errors
         return (intelligence_score >= 2 and problem_solving_score >= 1 and error_count <= 1)
     
     def record_test_result(self, tool_id, tool, result, success):
-        """Record detailed test results"""
-        self.test_results["test_details"][tool_id] = {
+        """Build the detailed test record for a tool"""
+        return {
             "tool_name": tool["name"],
             "test_scenario": tool["test_scenario"],
             "complexity": tool["complexity"],
             "skills_tested": tool["skills_tested"],
             "success": success,
             "execution_time": result.get("execution_time", 0),
-            "output_length": len(result.get("stdout", "")),
+            "output_length": result.get("output_length", 0),
             "has_errors": bool(result.get("stderr", "")),
             "timestamp": datetime.now().isoformat()
         }
     
     def generate_final_report(self):
         """Generate comprehensive test report"""
+        self.stop_jarvis()
         self.test_results["end_time"] = datetime.now().isoformat()
         self.test_results["success_rate"] = (self.test_results["tools_passed"] / self.test_results["tools_tested"]) * 100
         
@@ -337,12 +518,17 @@ class JARVISIntelligenceTester:
         print(f"📈 Success Rate: {self.test_results['success_rate']:.1f}%")
         print()
         
-        # Save detailed results
+        # Save the summary; per-test details were already streamed to details_file
+        self.test_results["details_file"] = self.details_file
         report_file = f"JARVIS_Intelligence_Test_Report_{self.test_results['session_id']}.json"
-        with open(report_file, 'w') as f:
-            json.dump(self.test_results, f, indent=2)
+        if ORJSON_AVAILABLE:
+            Path(report_file).write_bytes(orjson.dumps(self.test_results, option=orjson.OPT_INDENT_2))
+        else:
+            with open(report_file, 'w') as f:
+                json.dump(self.test_results, f, indent=2)
         
-        print(f"📄 Detailed report saved: {report_file}")
+        print(f"📄 Summary report saved: {report_file}")
+        print(f"📄 Per-test details: {self.details_file}")
         
         # Provide improvement recommendations
         if self.test_results["tools_failed"] > 0:
@@ -355,8 +541,15 @@ class JARVISIntelligenceTester:
 
 def main():
     """Main testing workflow"""
+    parser = argparse.ArgumentParser(description="JARVIS Intelligence Testing Workflow")
+    parser.add_argument("--batch-size", type=int, default=3,
+                        help="number of tools tested against each JARVIS REPL")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="number of parallel worker processes (default: min(CPUs, 8))")
+    args = parser.parse_args()
+    
     tester = JARVISIntelligenceTester()
-    tester.run_comprehensive_test()
+    tester.run_comprehensive_test(batch_size=max(args.batch_size, 1), max_workers=args.workers)
 
 if __name__ == "__main__":
     main()
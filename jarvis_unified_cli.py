@@ -7,28 +7,40 @@ Warp Terminal-inspired unified prompt for AI chat and shell commands
 import os
 import sys
 import signal
+import selectors
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
 from rich.layout import Layout
 from rich.live import Live
-from rich.prompt import Prompt
 from rich.status import Status
 from rich.table import Table
 from rich import box
 
-# Add the project root to Python path
-sys.path.append(str(Path(__file__).parent))
-
-from jarvis import JARVIS
-from modules.unified_terminal import UnifiedTerminal
+# Add the project root to Python path (once)
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if _HERE not in sys.path:
+    sys.path.insert(0, _HERE)
 
 class JARVISUnifiedCLI:
     """
     Unified CLI interface that combines AI chat and terminal functionality
     """
     
+    # Mode indicators
+    _MODE_ICONS = MappingProxyType({
+        'shell': '🖥️',
+        'ai': '🤖',
+        'intelligent': '🧠',
+        'auto': '⚡'
+    })
+    
+    # (icon, style) indexed by success
+    _STATUS = (('❌', 'red'), ('✅', 'green'))
+    
     def __init__(self):
         self.console = Console()
         self.jarvis = None
@@ -36,6 +48,36 @@ class JARVISUnifiedCLI:
         self.running = True
         self.terminal_mode = True  # Always in unified mode
         
+        # Static help panel, built once
+        self._help_panel = self.create_help_panel()
+        
+        # Special CLI commands, dispatched by their normalized text
+        self._special_commands = {
+            'exit': self._cmd_exit,
+            'quit': self._cmd_exit,
+            'q': self._cmd_exit,
+            'help': self._cmd_help,
+            '?': self._cmd_help,
+            'clear': self._cmd_clear,
+            'history': self._cmd_history
+        }
+        
+        # Prompt for the current directory; rebuilt only when a cd changes it
+        self._cached_cwd_name = Path(os.getcwd()).name
+        self._prompt_text = self._prompt_for(self._cached_cwd_name)
+        
+        # Signals wake the input loop through a self-pipe instead of exiting mid-render
+        self._wakeup_r, self._wakeup_w = os.pipe()
+        os.set_blocking(self._wakeup_w, False)
+        signal.set_wakeup_fd(self._wakeup_w)
+        
+        # stdin is read in raw chunks so buffered lines are never hidden from select
+        self._stdin_fd = sys.stdin.fileno()
+        self._input_buffer = b""
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._stdin_fd, selectors.EVENT_READ)
+        self._selector.register(self._wakeup_r, selectors.EVENT_READ)
+        
         # Setup signal handlers
         signal.signal(signal.SIGINT, self.signal_handler)
         signal.signal(signal.SIGTERM, self.signal_handler)
@@ -44,12 +86,34 @@ class JARVISUnifiedCLI:
         """Handle interrupt signals gracefully"""
         self.console.print("\n👋 JARVIS shutting down gracefully...")
         self.running = False
-        sys.exit(0)
+    
+    def read_input_line(self, prompt_text: str):
+        """Prompt and wait for a line of input; returns None once shutdown is requested"""
+        self.console.print(prompt_text, end="")
+        while b"\n" not in self._input_buffer:
+            if not self.running:
+                return None
+            for key, _ in self._selector.select():
+                if key.fd == self._wakeup_r:
+                    os.read(self._wakeup_r, 512)  # Drain signal bytes; the handler already ran
+                    continue
+                chunk = os.read(self._stdin_fd, 4096)
+                if not chunk:
+                    if not self._input_buffer:
+                        raise EOFError
+                    self._input_buffer += b"\n"
+                self._input_buffer += chunk
+        line, _, self._input_buffer = self._input_buffer.partition(b"\n")
+        return line.decode(errors="replace")
     
     def initialize_jarvis(self):
         """Initialize JARVIS and unified terminal"""
         try:
             with Status("🤖 Initializing JARVIS...", console=self.console):
+                # Heavy imports are deferred until JARVIS is actually started
+                from jarvis import JARVIS
+                from modules.unified_terminal import UnifiedTerminal
+                
                 self.jarvis = JARVIS()
                 self.unified_terminal = UnifiedTerminal(self.jarvis)
                 
@@ -57,6 +121,7 @@ class JARVISUnifiedCLI:
                 if hasattr(self.jarvis.intent_classifier, 'set_terminal_context'):
                     self.jarvis.intent_classifier.set_terminal_context(True)
             
+            self.update_cwd(self.unified_terminal.get_current_directory())
             self.console.print("✅ JARVIS Unified Terminal ready!", style="bold green")
             return True
             
@@ -104,68 +169,59 @@ class JARVISUnifiedCLI:
             style="blue"
         )
     
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _prompt_for(cwd_name: str) -> str:
+        """Build the prompt markup for a directory name"""
+        return f"[cyan]JARVIS[/cyan] [yellow]{cwd_name}[/yellow] [dim]❯[/dim] "
+    
+    def update_cwd(self, cwd: str):
+        """Invalidate the cached directory name and prompt after a directory change"""
+        self._cached_cwd_name = Path(cwd).name
+        self._prompt_text = self._prompt_for(self._cached_cwd_name)
+    
     def format_output(self, result: dict) -> str:
         """Format command output based on mode and result"""
         if not result:
             return ""
         
-        mode = result.get('mode', 'unknown')
-        success = result.get('success', True)
         output = result.get('output', '')
         
-        # Mode indicators
-        mode_icons = {
-            'shell': '🖥️',
-            'ai': '🤖',
-            'intelligent': '🧠',
-            'auto': '⚡'
-        }
-        
-        mode_icon = mode_icons.get(mode, '❓')
-        
-        # Success/failure styling
-        if success:
-            status_style = "green"
-            status_icon = "✅"
-        else:
-            status_style = "red"
-            status_icon = "❌"
-        
         # Format output
         if output:
-            formatted = f"{mode_icon} {output}"
-        else:
-            formatted = f"{status_icon} Command completed"
+            return f"{self._MODE_ICONS.get(result.get('mode', 'unknown'), '❓')} {output}"
         
-        return formatted
+        status_icon, _ = self._STATUS[bool(result.get('success', True))]
+        return f"{status_icon} Command completed"
+    
+    def _cmd_exit(self):
+        self.running = False
+    
+    def _cmd_help(self):
+        self.console.print(self._help_panel)
+    
+    def _cmd_clear(self):
+        self.console.clear()
+    
+    def _cmd_history(self):
+        history = self.unified_terminal.get_command_history() if self.unified_terminal else []
+        if history:
+            self.console.print("📜 Command History:")
+            for i, cmd in enumerate(history[-10:], 1):
+                self.console.print(f"  {i}. {cmd}")
+        else:
+            self.console.print("📜 No command history")
     
     def process_special_commands(self, user_input: str) -> bool:
         """Handle special CLI commands"""
         user_input_lower = user_input.lower().strip()
         
-        if user_input_lower in ['exit', 'quit', 'q']:
-            self.running = False
+        command = self._special_commands.get(user_input_lower)
+        if command:
+            command()
             return True
         
-        elif user_input_lower in ['help', '?']:
-            self.console.print(self.create_help_panel())
-            return True
-        
-        elif user_input_lower == 'clear':
-            self.console.clear()
-            return True
-        
-        elif user_input_lower == 'history':
-            history = self.unified_terminal.get_command_history() if self.unified_terminal else []
-            if history:
-                self.console.print("📜 Command History:")
-                for i, cmd in enumerate(history[-10:], 1):
-                    self.console.print(f"  {i}. {cmd}")
-            else:
-                self.console.print("📜 No command history")
-            return True
-        
-        elif user_input_lower.startswith('mode '):
+        if user_input_lower.startswith('mode '):
             mode = user_input_lower[5:].strip()
             if self.unified_terminal:
                 try:
@@ -195,21 +251,16 @@ class JARVISUnifiedCLI:
         self.console.print()
         
         # Show quick help
-        self.console.print(self.create_help_panel())
+        self.console.print(self._help_panel)
         self.console.print()
         
         # Main interaction loop
         while self.running:
             try:
-                # Get current directory for prompt
-                cwd = self.unified_terminal.get_current_directory() if self.unified_terminal else os.getcwd()
-                cwd_name = Path(cwd).name
-                
-                # Create dynamic prompt
-                prompt_text = f"[cyan]JARVIS[/cyan] [yellow]{cwd_name}[/yellow] [dim]❯[/dim] "
-                
                 # Get user input
-                user_input = Prompt.ask(prompt_text, console=self.console)
+                user_input = self.read_input_line(self._prompt_text)
+                if user_input is None:
+                    break
                 
                 if not user_input.strip():
                     continue
@@ -222,6 +273,10 @@ class JARVISUnifiedCLI:
                 with Status("Processing...", console=self.console) as status:
                     result = self.unified_terminal.process_input(user_input)
                 
+                # Successful cd commands report the new directory
+                if result and 'cwd' in result:
+                    self.update_cwd(result['cwd'])
+                
                 # Display result
                 if result:
                     formatted_output = self.format_output(result)
@@ -1,22 +1,165 @@
 import os
+import re
+import json
+import time
+import queue
 import subprocess
-from openai import OpenAI
+from collections import OrderedDict
+import httpx
+from openai import OpenAI, APIStatusError, BadRequestError
 from dotenv import load_dotenv
 import pyttsx3
 import threading
+from concurrent.futures import ThreadPoolExecutor
 
 load_dotenv()
 
+# HTTP/2 lets concurrent completions share one connection (needs httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Speech cleanup patterns, compiled once
+_RE_MARKDOWN = re.compile(r'\*\*([^*]+)\*\*|\*([^*]+)\*|`([^`]+)`')  # **bold**, *italic*, `code`
+_STRIP_CHARS_TABLE = str.maketrans('', '', '"\'[]{}()#@$%^&*+=|\\<>~`')  # quotes, brackets, symbols
+_RE_NEWLINES = re.compile(r'\n+')
+_RE_WHITESPACE = re.compile(r'\s+')
+
+# generate_command cache: LRU size, entry lifetime, and inputs too volatile to cache
+COMMAND_CACHE_SIZE = 256
+COMMAND_CACHE_TTL = 300
+_RE_VOLATILE_INPUT = re.compile(r'\d|/tmp\b')
+
+# generate_command sampling: a command is a single short line. MiniMax-M2.1's
+# reasoning tokens count toward max_tokens even with reasoning_split, so the
+# cap leaves room for them; fences are stripped after generation
+COMMAND_MAX_TOKENS = 256
+COMMAND_STOP = ["\n"]
+COMMAND_TEMPERATURE = 0.1
+
+# Obviously destructive requests, rejected before any API call
+_RE_DANGER = re.compile(r'\b(rm\s+-rf|mkfs|dd\s+if=)|:\(\)\s*\{', re.IGNORECASE)
+
+# Code fences/backticks and a leading "Command:"-style label in generated commands
+_RE_CODE_FENCE = re.compile(r'```(?:bash)?|`')
+_RE_COMMAND_LABEL = re.compile(r'^\s*(?:command|cmd|bash|shell)\s*:\s*', re.I)
+
+# JSON array in a batched reply, possibly wrapped in a code fence
+_RE_JSON_ARRAY = re.compile(r'\[.*\]', re.DOTALL)
+
+# One sentence: shortest run ending in terminators plus whitespace/end, or a line break
+_RE_SENT = re.compile(r'.*?(?:[.!?]+(?:\s+|$)|\n+)', re.S)
+
+def iter_sentences(text, pos=0):
+    """Yield consecutive sentences of text starting at offset pos"""
+    for match in _RE_SENT.finditer(text, pos):
+        if not match.group(0):
+            return
+        yield match.group(0)
+
+# Prompts, built once at import instead of on every request
+_SYS_JARVIS = "You are JARVIS, an intelligent AI assistant. Be concise and direct."
+_SYS_BATCH = (_SYS_JARVIS + " You will receive several numbered requests. Answer each one independently "
+              "and reply with ONLY a JSON array of strings, one answer per request, in order.")
+_SYS_CMDGEN = "You are JARVIS, a helpful AI assistant that generates safe Linux commands."
+_CMDGEN_TEMPLATE = """You are JARVIS, an advanced AI assistant. Convert this natural language request into a Linux terminal command.
+
+User request: "{user_input}"
+Current directory: {current_dir}
+
+Rules:
+- Return ONLY the command on a single line, no explanation or code fences
+- If unclear or dangerous, return "UNSAFE" or "UNCLEAR"  
+- Use common Linux tools (ls, cd, find, grep, etc.)
+- Prefer safe, non-destructive commands
+
+Command:"""
+_SYS_ADVANCED = """You are JARVIS, an advanced AI assistant capable of complex task execution.
+You can:
+1. Generate and execute multiple commands in sequence
+2. Create files and projects
+3. Control system applications
+4. Provide intelligent responses
+
+Analyze the user's request and provide a structured response with:
+- action_type: "command", "multi_command", "file_creation", "web_project", or "response"
+- commands: list of commands to execute (if applicable)
+- files: files to create with content (if applicable)
+- response: text response to speak to user
+
+Reply with a single JSON object containing those fields."""
+_ADVANCED_TEMPLATE = "Request: {user_input}\nCurrent directory: {current_dir}"
+
+# Process-wide singletons shared by every AIHandler instance
+_CLIENTS = {}  # api_key -> OpenAI client
+_TTS_ENGINE = None
+_TTS_QUEUE = None
+# espeak-ng fallback runs one utterance at a time so sentences stay in order
+_ESPEAK_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="jarvis-espeak")
+_SINGLETON_LOCK = threading.Lock()
+
+def _get_client(api_key):
+    """Return the shared OpenAI client for api_key, creating it on first use"""
+    with _SINGLETON_LOCK:
+        client = _CLIENTS.get(api_key)
+        if client is None:
+            http_client = httpx.Client(
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_connections=16, max_keepalive_connections=8),
+                timeout=httpx.Timeout(30.0, connect=5.0)
+            )
+            client = _CLIENTS[api_key] = OpenAI(
+                base_url="https://api.minimax.io/v1",
+                api_key=api_key,
+                http_client=http_client
+            )
+        return client
+
+def _get_engine():
+    """Return the shared (engine, queue) pair, initializing pyttsx3 once per process"""
+    global _TTS_ENGINE, _TTS_QUEUE
+    with _SINGLETON_LOCK:
+        if _TTS_ENGINE is None:
+            engine = pyttsx3.init()
+            engine.setProperty('rate', 180)
+            engine.setProperty('volume', 0.9)
+            
+            # Get available voices and set a good one
+            voices = engine.getProperty('voices')
+            if voices:
+                # Try to find a good voice (prefer female for JARVIS feel)
+                for voice in voices:
+                    if 'female' in voice.name.lower() or 'woman' in voice.name.lower():
+                        engine.setProperty('voice', voice.id)
+                        break
+            
+            # One worker owns the engine and plays queued utterances in order
+            _TTS_QUEUE = queue.Queue()
+            threading.Thread(target=_tts_worker, args=(engine, _TTS_QUEUE),
+                             name="jarvis-tts", daemon=True).start()
+            _TTS_ENGINE = engine
+        return _TTS_ENGINE, _TTS_QUEUE
+
+def _tts_worker(engine, tts_queue):
+    """Speak queued (text, clean_text) pairs one at a time"""
+    while True:
+        text, clean_text = tts_queue.get()
+        try:
+            engine.say(clean_text)
+            engine.runAndWait()
+        except Exception as e:
+            print(f"🤖 JARVIS: {text}")
+            print(f"⚠️ TTS Error: {e}")
+
 class AIHandler:
     def __init__(self):
         # Setup Minimax M2.1 via OpenAI SDK
         api_key = os.getenv('MINIMAX_API_KEY')
         
         if api_key:
-            self.client = OpenAI(
-                base_url="https://api.minimax.io/v1",
-                api_key=api_key
-            )
+            self.client = _get_client(api_key)
             self.model = 'MiniMax-M2.1'
             print("✅ Minimax M2.1 connected")
         else:
@@ -24,24 +167,22 @@ class AIHandler:
             self.model = None
             print("⚠️ AI disabled - Set MINIMAX_API_KEY in .env")
         
+        # (user_input, current_dir) -> (command, created_at), most recently used last
+        self._command_cache = OrderedDict()
+        self._command_cache_lock = threading.Lock()
+        
+        # Cleared if the provider rejects response_format for advanced requests
+        self._json_mode = True
+        
+        # Shared pool so independent LLM calls overlap
+        self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="jarvis-ai")
+        
         # Setup Text-to-Speech with fallback
         self.tts_engine = None
         self.tts_available = False
         
         try:
-            self.tts_engine = pyttsx3.init()
-            self.tts_engine.setProperty('rate', 180)
-            self.tts_engine.setProperty('volume', 0.9)
-            
-            # Get available voices and set a good one
-            voices = self.tts_engine.getProperty('voices')
-            if voices:
-                # Try to find a good voice (prefer female for JARVIS feel)
-                for voice in voices:
-                    if 'female' in voice.name.lower() or 'woman' in voice.name.lower():
-                        self.tts_engine.setProperty('voice', voice.id)
-                        break
-            
+            self.tts_engine, self._tts_queue = _get_engine()
             self.tts_available = True
             print("✅ Text-to-Speech initialized")
             
@@ -52,22 +193,15 @@ class AIHandler:
 
     def clean_text_for_speech(self, text):
         """Clean text for speech by removing symbols and formatting"""
-        import re
-        
-        # Remove markdown formatting
-        text = re.sub(r'\*\*([^*]+)\*\*', r'\1', text)  # **bold** -> bold
-        text = re.sub(r'\*([^*]+)\*', r'\1', text)      # *italic* -> italic
-        text = re.sub(r'`([^`]+)`', r'\1', text)        # `code` -> code
+        # Remove markdown formatting in one pass
+        text = _RE_MARKDOWN.sub(lambda m: m.group(1) or m.group(2) or m.group(3), text)
         
-        # Remove quotes and brackets
-        text = re.sub(r'["\'\[\]{}()]', '', text)       # Remove quotes and brackets
+        # Remove quotes, brackets and special symbols but keep basic punctuation
+        text = text.translate(_STRIP_CHARS_TABLE)
         
-        # Remove special symbols but keep basic punctuation
-        text = re.sub(r'[#@$%^&*+=|\\<>~`]', '', text)  # Remove symbols
-        
-        # Clean up multiple spaces and newlines
-        text = re.sub(r'\s+', ' ', text)                # Multiple spaces -> single space
-        text = re.sub(r'\n+', '. ', text)               # Newlines -> periods
+        # Newlines -> periods, then collapse remaining whitespace
+        text = _RE_NEWLINES.sub('. ', text)
+        text = _RE_WHITESPACE.sub(' ', text)
         
         # Remove leading/trailing whitespace
         text = text.strip()
@@ -80,88 +214,198 @@ class AIHandler:
         clean_text = self.clean_text_for_speech(text)
         
         if not self.tts_available:
-            # Fallback to espeak-ng directly
-            try:
-                subprocess.run(['espeak-ng', clean_text], 
-                             stdout=subprocess.DEVNULL, 
-                             stderr=subprocess.DEVNULL, 
-                             timeout=10)
-                return
-            except:
-                pass
-            
-            # Final fallback - just print
-            print(f"🤖 JARVIS: {text}")
+            # Fallback to espeak-ng directly, off the caller's thread
+            _ESPEAK_POOL.submit(self._speak_espeak, text, clean_text)
             return
-            
-        def _speak():
-            try:
-                self.tts_engine.say(clean_text)
-                self.tts_engine.runAndWait()
-            except Exception as e:
-                print(f"🤖 JARVIS: {text}")
-                print(f"⚠️ TTS Error: {e}")
-        
-        # Run TTS in separate thread to avoid blocking
-        thread = threading.Thread(target=_speak)
-        thread.daemon = True
-        thread.start()
-
-    def get_response(self, prompt):
-        """Get AI response for general queries"""
+        
+        # Hand off to the TTS worker; returns immediately
+        self._tts_queue.put((text, clean_text))
+
+    def _speak_espeak(self, text, clean_text):
+        """Speak through espeak-ng, printing the text if that fails"""
+        try:
+            subprocess.run(['espeak-ng', clean_text], 
+                         stdout=subprocess.DEVNULL, 
+                         stderr=subprocess.DEVNULL, 
+                         timeout=10)
+            return
+        except:
+            pass
+        
+        # Final fallback - just print
+        print(f"🤖 JARVIS: {text}")
+
+    def _stream_completion(self, on_text=None, **kwargs):
+        """Run a streaming chat completion and return the full content
+        
+        on_text, if given, is called with each content piece as it arrives.
+        """
+        parts = []
+        for chunk in self.client.chat.completions.create(stream=True, **kwargs):
+            if not chunk.choices:
+                continue
+            piece = chunk.choices[0].delta.content
+            if piece:
+                parts.append(piece)
+                if on_text:
+                    on_text(piece)
+        return "".join(parts)
+
+    def _sentence_speaker(self):
+        """Return (feed, flush) callbacks that speak streamed text sentence by sentence"""
+        pending = ""
+        
+        def feed(piece):
+            nonlocal pending
+            text = pending + piece
+            pos = 0
+            for sentence in iter_sentences(text):
+                # A terminator at the very end may still be mid-sentence ("e.g", "...")
+                if pos + len(sentence) == len(text) and not sentence[-1].isspace():
+                    break
+                pos += len(sentence)
+                if sentence.strip():
+                    self.speak(sentence)
+            pending = text[pos:]
+        
+        def flush():
+            nonlocal pending
+            text = pending.strip()
+            pending = ""
+            if text:
+                self.speak(text)
+        
+        return feed, flush
+
+    def get_response_async(self, prompt, speak=False):
+        """Submit get_response to the shared pool; returns a Future"""
+        return self._pool.submit(self.get_response, prompt, speak)
+
+    def generate_command_async(self, user_input, current_dir):
+        """Submit generate_command to the shared pool; returns a Future"""
+        return self._pool.submit(self.generate_command, user_input, current_dir)
+
+    def process_advanced_request_async(self, user_input, current_dir):
+        """Submit process_advanced_request to the shared pool; returns a Future"""
+        return self._pool.submit(self.process_advanced_request, user_input, current_dir)
+
+    def get_response(self, prompt, speak=False):
+        """Get AI response for general queries
+        
+        With speak=True each sentence is spoken as soon as it has streamed in.
+        """
         if not self.client:
             return "AI not available"
         
+        feed, flush = self._sentence_speaker() if speak else (None, None)
         try:
-            response = self.client.chat.completions.create(
+            response = self._stream_completion(
+                on_text=feed,
                 model=self.model,
                 messages=[
-                    {"role": "system", "content": "You are JARVIS, an intelligent AI assistant. Be concise and direct."},
+                    {"role": "system", "content": _SYS_JARVIS},
                     {"role": "user", "content": prompt}
                 ],
                 max_tokens=200,
                 temperature=0.3
             )
             
-            return response.choices[0].message.content.strip()
+            if flush:
+                flush()
+            return response.strip()
             
         except Exception as e:
             return f"AI Error: {str(e)}"
 
-    def generate_command(self, user_input, current_dir):
-        """Use Minimax M2.1 to generate command from natural language"""
+    def process_batch(self, prompts, current_dir=None):
+        """Answer several independent prompts with a single API call
+        
+        Returns a list of answers in prompt order. Falls back to parallel
+        single requests if the batched reply can't be parsed.
+        """
+        if not prompts:
+            return []
+        if len(prompts) == 1:
+            return [self.get_response(prompts[0])]
+        if not self.client:
+            return ["AI not available"] * len(prompts)
+        
+        numbered = "\n".join(f"{i}. {prompt}" for i, prompt in enumerate(prompts, 1))
+        if current_dir:
+            numbered += f"\n\nCurrent directory: {current_dir}"
+        
+        try:
+            reply = self._stream_completion(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": _SYS_BATCH},
+                    {"role": "user", "content": numbered}
+                ],
+                max_tokens=200 * len(prompts),
+                temperature=0.3
+            )
+            
+            match = _RE_JSON_ARRAY.search(reply)
+            answers = json.loads(match.group(0)) if match else None
+            if isinstance(answers, list) and len(answers) == len(prompts):
+                return [str(answer).strip() for answer in answers]
+        except Exception as e:
+            print(f"⚠️ Batched AI request failed: {e}")
+        
+        # Fall back to one request per prompt, run concurrently
+        futures = [self.get_response_async(prompt) for prompt in prompts]
+        return [future.result() for future in futures]
+
+    def generate_command(self, user_input, current_dir, on_text=None):
+        """Use Minimax M2.1 to generate command from natural language
+        
+        on_text, if given, receives the command text as it streams in.
+        """
         if not self.client:
             return None
+        
+        # Reject empty/trivial and known-destructive requests without a round-trip
+        if len(user_input.strip()) <= 2 or _RE_DANGER.search(user_input):
+            return None
+        
+        key = (user_input, str(current_dir))
+        cacheable = not _RE_VOLATILE_INPUT.search(user_input)
+        if cacheable:
+            with self._command_cache_lock:
+                cached = self._command_cache.get(key)
+                if cached and time.monotonic() - cached[1] < COMMAND_CACHE_TTL:
+                    self._command_cache.move_to_end(key)
+                    if on_text:
+                        on_text(cached[0])
+                    return cached[0]
     
-        prompt = f"""You are JARVIS, an advanced AI assistant. Convert this natural language request into a Linux terminal command.
-
-User request: "{user_input}"
-Current directory: {current_dir}
-
-Rules:
-- Return ONLY the command, no explanation
-- If unclear or dangerous, return "UNSAFE" or "UNCLEAR"  
-- Use common Linux tools (ls, cd, find, grep, etc.)
-- Prefer safe, non-destructive commands
-
-Command:"""
+        prompt = _CMDGEN_TEMPLATE.format_map({"user_input": user_input, "current_dir": current_dir})
 
         try:
-            response = self.client.chat.completions.create(
+            command = self._stream_completion(
+                on_text=on_text,
                 model=self.model,
                 messages=[
-                    {"role": "system", "content": "You are JARVIS, a helpful AI assistant that generates safe Linux commands."},
+                    {"role": "system", "content": _SYS_CMDGEN},
                     {"role": "user", "content": prompt}
                 ],
                 extra_body={"reasoning_split": True},
-                temperature=0.7
-            )
-        
-            command = response.choices[0].message.content.strip()
-            command = command.replace('```bash', '').replace('```', '').replace('`', '').strip()
+                max_tokens=COMMAND_MAX_TOKENS,
+                stop=COMMAND_STOP,
+                temperature=COMMAND_TEMPERATURE
+            ).strip()
+            command = _RE_CODE_FENCE.sub('', command).strip()
+            command = _RE_COMMAND_LABEL.sub('', command)
         
-            if command.upper() in ['UNSAFE', 'UNCLEAR']:
+            if not command or command.upper() in ['UNSAFE', 'UNCLEAR']:
                 return None
+            
+            if cacheable:
+                with self._command_cache_lock:
+                    self._command_cache[key] = (command, time.monotonic())
+                    self._command_cache.move_to_end(key)
+                    if len(self._command_cache) > COMMAND_CACHE_SIZE:
+                        self._command_cache.popitem(last=False)
         
             return command
         
@@ -173,32 +417,27 @@ Command:"""
         """Handle advanced requests that go beyond simple commands"""
         if not self.client:
             return None
-            
-        system_prompt = """You are JARVIS, an advanced AI assistant capable of complex task execution.
-You can:
-1. Generate and execute multiple commands in sequence
-2. Create files and projects
-3. Control system applications
-4. Provide intelligent responses
-
-Analyze the user's request and provide a structured response with:
-- action_type: "command", "multi_command", "file_creation", "web_project", or "response"
-- commands: list of commands to execute (if applicable)
-- files: files to create with content (if applicable)
-- response: text response to speak to user"""
 
+        request = dict(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": _SYS_ADVANCED},
+                {"role": "user", "content": _ADVANCED_TEMPLATE.format_map({"user_input": user_input, "current_dir": current_dir})}
+            ],
+            extra_body={"reasoning_split": True},
+            temperature=0.8
+        )
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": f"Request: {user_input}\nCurrent directory: {current_dir}"}
-                ],
-                extra_body={"reasoning_split": True},
-                temperature=0.8
-            )
-            
-            return response.choices[0].message.content
+            if self._json_mode:
+                try:
+                    return self._stream_completion(response_format={"type": "json_object"}, **request)
+                except APIStatusError as e:
+                    # Only a rejected response_format turns JSON mode off and is retried;
+                    # outages, rate limits and server errors go to the handler below
+                    if not (isinstance(e, BadRequestError) and 'response_format' in str(e)):
+                        raise
+                    self._json_mode = False
+            return self._stream_completion(**request)
             
         except Exception as e:
             print(f"❌ Advanced AI Error: {e}")
@@ -1,11 +1,24 @@
 import subprocess
+import shutil
 import psutil
 import os
+import sys
 import time
 
+# Opened once and shared by every detached launch
+_DEVNULL_R = open(os.devnull, 'rb')
+_DEVNULL_W = open(os.devnull, 'wb')
+
+# posix_spawn file actions: stdin/stdout/stderr all on /dev/null
+_SPAWN_FILE_ACTIONS = [
+    (os.POSIX_SPAWN_DUP2, _DEVNULL_R.fileno(), 0),
+    (os.POSIX_SPAWN_DUP2, _DEVNULL_W.fileno(), 1),
+    (os.POSIX_SPAWN_DUP2, _DEVNULL_W.fileno(), 2),
+] if hasattr(os, 'posix_spawnp') else None
+
 class ApplicationManager:
     def __init__(self):
-        self.app_database = {
+        app_database = {
             # Browsers
             'chrome': ['google-chrome', 'chromium', 'google-chrome-stable'],
             'firefox': ['firefox'],
@@ -41,31 +54,102 @@ class ApplicationManager:
             'settings': ['gnome-control-center', 'systemsettings5'],
             'task manager': ['gnome-system-monitor', 'htop', 'btop']
         }
+        # Interned lowercase keys and immutable candidate tuples
+        self.app_database = {sys.intern(name.lower()): tuple(candidates)
+                             for name, candidates in app_database.items()}
+        
+        # Names of every file on PATH, scanned once at startup
+        self._path_set: set[str] = self._scan_path()
+        
+        # Any app name or alias -> database key, and name -> chosen executable
+        self._alias_to_canonical: dict[str, str] = {}
+        self._resolved: dict[str, str] = {}
+        for name, candidates in self.app_database.items():
+            self._alias_to_canonical[name] = name
+            executable = next((c for c in candidates if c in self._path_set), None)
+            if executable:
+                self._resolved[name] = executable
+        for name, candidates in self.app_database.items():
+            for alias in candidates:
+                self._alias_to_canonical.setdefault(sys.intern(alias), name)
+                # An alias that is itself installed launches itself
+                if alias in self._path_set:
+                    self._resolved.setdefault(alias, alias)
+        
+        # shutil.which results for names outside the PATH scan
+        self._which_cache: dict[str, str | None] = {}
+        
+        # Process table snapshot shared by is_app_running/get_running_apps
+        self._proc_snapshot = None
+        self._proc_handles = []
+        self._proc_names = set()
+        self._snapshot_ts = 0.0
+        
+        # Children started with posix_spawn, reaped on later launches
+        self._spawned = []
+    
+    @staticmethod
+    def _scan_path():
+        """Collect the file names in every PATH directory with one walk"""
+        names = set()
+        for directory in os.get_exec_path():
+            try:
+                with os.scandir(directory or os.curdir) as entries:
+                    names.update(entry.name for entry in entries)
+            except OSError:
+                continue
+        return names
     
     def find_executable(self, app_name):
         """Find the best executable for an app"""
-        app_name = app_name.lower()
+        app_name = sys.intern(app_name.lower())
         
-        if app_name in self.app_database:
-            for executable in self.app_database[app_name]:
-                if self.is_installed(executable):
-                    return executable
+        resolved = self._resolved.get(app_name) or \
+            self._resolved.get(self._alias_to_canonical.get(app_name))
+        if resolved:
+            return resolved
         
-        # Try direct name if not in database
+        # Try direct name if not in database (or installed since startup)
         if self.is_installed(app_name):
+            self._resolved[app_name] = app_name
             return app_name
             
         return None
     
     def is_installed(self, executable):
         """Check if an executable is installed"""
-        try:
-            subprocess.run(['which', executable], 
-                         capture_output=True, 
-                         check=True)
+        if executable in self._path_set:
             return True
-        except subprocess.CalledProcessError:
-            return False
+        
+        if executable not in self._which_cache:
+            self._which_cache[executable] = shutil.which(executable)
+        return self._which_cache[executable] is not None
+    
+    def _spawn_detached(self, cmd):
+        """Start cmd in its own session with stdio on /dev/null"""
+        # Reap earlier children that have exited so they don't linger as zombies
+        for pid in self._spawned[:]:
+            try:
+                if os.waitpid(pid, os.WNOHANG)[0]:
+                    self._spawned.remove(pid)
+            except ChildProcessError:
+                self._spawned.remove(pid)
+        
+        if _SPAWN_FILE_ACTIONS is not None:
+            try:
+                # No fork of this (large) interpreter, unlike Popen's fork+exec path
+                pid = os.posix_spawnp(cmd[0], cmd, os.environ,
+                                      file_actions=_SPAWN_FILE_ACTIONS, setsid=True)
+                self._spawned.append(pid)
+                return
+            except (OSError, NotImplementedError, TypeError):
+                pass
+        
+        subprocess.Popen(cmd,
+                         stdin=_DEVNULL_R,
+                         stdout=_DEVNULL_W,
+                         stderr=_DEVNULL_W,
+                         start_new_session=True)
     
     def launch_app(self, app_name, args=None):
         """Launch an application"""
@@ -78,9 +162,8 @@ class ApplicationManager:
             if args:
                 cmd.extend(args)
                 
-            subprocess.Popen(cmd, 
-                           stdout=subprocess.DEVNULL, 
-                           stderr=subprocess.DEVNULL)
+            self._spawn_detached(cmd)
+            self._snapshot_ts = 0.0
             return True, f"Launched {app_name}"
         except Exception as e:
             return False, f"Failed to launch {app_name}: {e}"
@@ -91,39 +174,72 @@ class ApplicationManager:
         if not executable:
             return False, f"Application '{app_name}' not found"
         
-        try:
-            subprocess.run(['pkill', '-f', executable], check=True)
-            return True, f"Killed {app_name}"
-        except subprocess.CalledProcessError:
+        # Fresh snapshot so we don't signal processes that already exited
+        self._procs(max_age=0)
+        own_pid = os.getpid()
+        targets = [proc for proc, app in zip(self._proc_handles, self._proc_snapshot)
+                   if proc.pid != own_pid
+                   and (app['name'] == executable or executable in app['cmdline'])]
+        
+        signalled = []
+        for proc in targets:
+            try:
+                proc.terminate()
+                signalled.append(proc)
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+        if not signalled:
             return False, f"Failed to kill {app_name} or not running"
-    
-    def get_running_apps(self):
-        """Get list of running applications"""
-        apps = []
-        for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
+        
+        # Give apps a chance to exit cleanly, then force the stragglers
+        _, alive = psutil.wait_procs(signalled, timeout=2)
+        for proc in alive:
             try:
-                apps.append({
-                    'pid': proc.info['pid'],
-                    'name': proc.info['name'],
-                    'cmdline': ' '.join(proc.info['cmdline']) if proc.info['cmdline'] else ''
-                })
+                proc.kill()
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 pass
-        return apps
+        
+        self._snapshot_ts = 0.0
+        return True, f"Killed {app_name}"
+    
+    def _procs(self, max_age=0.5):
+        """Return running process names, rescanning at most every max_age seconds"""
+        now = time.monotonic()
+        if self._proc_snapshot is None or now - self._snapshot_ts > max_age:
+            apps = []
+            handles = []
+            for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
+                try:
+                    apps.append({
+                        'pid': proc.info['pid'],
+                        'name': proc.info['name'],
+                        'cmdline': ' '.join(proc.info['cmdline']) if proc.info['cmdline'] else ''
+                    })
+                    handles.append(proc)
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    pass
+            self._proc_snapshot = apps
+            self._proc_handles = handles
+            self._proc_names = {app['name'] for app in apps if app['name']}
+            self._snapshot_ts = now
+        return self._proc_names
+    
+    def get_running_apps(self):
+        """Get list of running applications"""
+        self._procs()
+        return list(self._proc_snapshot)
     
     def is_app_running(self, app_name):
         """Check if an application is running"""
         executable = self.find_executable(app_name)
         if not executable:
             return False
-            
-        for proc in psutil.process_iter(['name']):
-            try:
-                if executable in proc.info['name']:
-                    return True
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                pass
-        return False
+        
+        names = self._procs()
+        if executable in names:
+            return True
+        # Process names can be truncated or decorated, so fall back to substring match
+        return any(executable in name for name in names)
     
     def restart_app(self, app_name):
         """Restart an application"""
@@ -131,7 +247,6 @@ class ApplicationManager:
             success, msg = self.kill_app(app_name)
             if not success:
                 return False, msg
-            time.sleep(1)  # Wait for app to close
         
         return self.launch_app(app_name)
     
@@ -144,17 +259,13 @@ class ApplicationManager:
             if app_name:
                 executable = self.find_executable(app_name)
                 if executable:
-                    subprocess.Popen([executable, file_path],
-                                   stdout=subprocess.DEVNULL,
-                                   stderr=subprocess.DEVNULL)
+                    self._spawn_detached([executable, file_path])
                     return True, f"Opened {file_path} with {app_name}"
                 else:
                     return False, f"Application {app_name} not found"
             else:
                 # Use default application
-                subprocess.Popen(['xdg-open', file_path],
-                               stdout=subprocess.DEVNULL,
-                               stderr=subprocess.DEVNULL)
+                self._spawn_detached(['xdg-open', file_path])
                 return True, f"Opened {file_path} with default application"
         except Exception as e:
             return False, f"Failed to open file: {e}"
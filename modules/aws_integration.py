@@ -1,44 +1,383 @@
 import subprocess
 import json
 import os
-from typing import Dict, List, Any, Optional
+import re
+import shutil
+import signal
+import sys
+import tempfile
+import threading
+import time
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 
+# boto3 makes in-process API calls; the aws CLI subprocess is the fallback
+try:
+    import boto3
+    from botocore.config import Config as BotocoreConfig
+    from botocore.exceptions import BotoCoreError, ClientError, UnknownServiceError
+    BOTO3_AVAILABLE = True
+except ImportError:
+    BOTO3_AVAILABLE = False
+
+# orjson serializes execute_custom output much faster than json.dumps
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# ijson parses large CLI listings incrementally (picks the yajl2_c backend when built)
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Top-level list key of each large listing, streamed item by item from the CLI
+_STREAM_LIST_KEYS = {
+    'describe-instances': 'Reservations',
+    'list-buckets': 'Buckets',
+    'list-functions': 'Functions',
+    'describe-db-instances': 'DBInstances',
+    'describe-vpcs': 'Vpcs',
+    'list-stacks': 'StackSummaries',
+}
+
+# Status icons for the listing formatters
+_EC2_STATE_ICONS = {"running": "🟢", "stopped": "🔴", "pending": "🟡", "stopping": "🟠"}
+_VPC_STATE_ICONS = {"available": "🟢", "pending": "🟡"}
+_VPC_DEFAULT_ICONS = ("🌐", "⭐")  # indexed by IsDefault
+_CFN_STATUS_ICONS = {
+    "CREATE_COMPLETE": "✅",
+    "UPDATE_COMPLETE": "🔄",
+    "DELETE_COMPLETE": "🗑️",
+    "ROLLBACK_COMPLETE": "↩️"
+}
+_RDS_STATUS_ICONS = {"available": "🟢", "stopped": "🔴", "starting": "🟡"}
+
+# Shared pool for fanning region sweeps out concurrently (calls are network-bound)
+_REGION_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix="aws-region")
+
+# Read-only results are reused for this many seconds
+_CACHE_TTL = 60
+_CACHEABLE_PREFIXES = ('list-', 'describe-', 'get-')
+
+# CLI service names that boto3 knows under another name
+_BOTO3_SERVICE_NAMES = {'s3api': 's3'}
+
+# CLI shorthand structure value, e.g. "Start=2024-01-01,End=2024-02-01"
+_RE_SHORTHAND = re.compile(r'^\w+=[^,]*(?:,\w+=[^,]*)*$')
+
+def _coerce_to_shape(value: Any, shape) -> Any:
+    """Coerce a CLI-style value to the type botocore expects for shape
+    
+    Raises ValueError (or TypeError) when the value can't be expressed as that type.
+    """
+    type_name = shape.type_name
+    if type_name in ('integer', 'long'):
+        return int(value)
+    if type_name in ('float', 'double'):
+        return float(value)
+    if type_name == 'boolean':
+        if isinstance(value, bool):
+            return value
+        lowered = str(value).lower()
+        if lowered in ('true', '1', 'yes'):
+            return True
+        if lowered in ('false', '0', 'no'):
+            return False
+        raise ValueError(f"Not a boolean: {value!r}")
+    if type_name == 'list':
+        if isinstance(value, str):
+            # A shorthand structure is one item; anything else is comma separated
+            if shape.member.type_name == 'structure':
+                value = [value]
+            else:
+                value = value.split(',')
+        return [_coerce_to_shape(item, shape.member) for item in value]
+    if type_name == 'structure':
+        if isinstance(value, str):
+            if not _RE_SHORTHAND.match(value):
+                raise ValueError(f"Not a shorthand structure: {value!r}")
+            value = dict(item.split('=', 1) for item in value.split(','))
+        return _to_boto3_params(value, shape)
+    return value
+
+def _to_boto3_params(parameters: Dict[str, Any], input_shape) -> Dict[str, Any]:
+    """Convert CLI-style parameters (kebab-case keys, string values) to boto3 kwargs
+    
+    Keys are matched to the shape's members ignoring case and dashes, so
+    db-instance-identifier finds DBInstanceIdentifier. Raises ValueError for a
+    key the operation doesn't take or a value that can't be coerced.
+    """
+    members = {name.lower(): (name, shape) for name, shape in input_shape.members.items()} \
+        if input_shape is not None else {}
+    params = {}
+    for key, value in parameters.items():
+        member = members.get(key.replace('-', '').lower())
+        if member is None:
+            raise ValueError(f"Unknown parameter: {key}")
+        name, shape = member
+        params[name] = _coerce_to_shape(value, shape)
+    return params
+
+def _iso_date(value: Any) -> str:
+    """Date part of an ISO timestamp; anything else (e.g. "Unknown") as a string"""
+    if isinstance(value, str):
+        return value[:10] if len(value) > 10 else value
+    return str(value)[:10]
+
+def _trim_for_display(value: Any, max_items: int = 10, max_chars: int = 500) -> Tuple[Any, bool]:
+    """Cap lists and long strings so only the displayed part of a response gets serialized
+    
+    Returns (trimmed, truncated); dropped list items leave a "... (N more)" element
+    and cut strings end in "...".
+    """
+    if isinstance(value, dict):
+        trimmed, truncated = {}, False
+        for k, v in value.items():
+            trimmed[k], cut = _trim_for_display(v, max_items, max_chars)
+            truncated = truncated or cut
+        return trimmed, truncated
+    if isinstance(value, list):
+        trimmed, truncated = [], len(value) > max_items
+        for v in value[:max_items]:
+            item, cut = _trim_for_display(v, max_items, max_chars)
+            trimmed.append(item)
+            truncated = truncated or cut
+        if len(value) > max_items:
+            trimmed.append(f"... ({len(value) - max_items} more)")
+        return trimmed, truncated
+    if isinstance(value, str) and len(value) > max_chars:
+        return value[:max_chars] + "...", True
+    return value, False
+
+def _to_cli_json(value: Any) -> Any:
+    """Make a boto3 response look like the CLI's JSON output (ISO dates, no metadata)
+    
+    Keys are interned while the dicts are rebuilt, so every item of a long listing
+    shares one key object per field and the formatters' .get() calls hit by identity.
+    """
+    if isinstance(value, dict):
+        return {sys.intern(k): _to_cli_json(v) for k, v in value.items() if k != 'ResponseMetadata'}
+    if isinstance(value, list):
+        return [_to_cli_json(v) for v in value]
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
 class AWSCLIManager:
     """
     AWS CLI Integration with command execution and resource management
     """
     
     def __init__(self):
-        self.aws_cli_available = self._check_aws_cli()
+        self.aws_cli_available = BOTO3_AVAILABLE or self._check_aws_cli()
         self.default_region = os.environ.get('AWS_DEFAULT_REGION', 'us-east-1')
         self.profile = os.environ.get('AWS_PROFILE', 'default')
+        
+        # boto3 sessions per profile and clients per (service, region, profile)
+        self._session = None
+        self._sessions: Dict[str, Any] = {}
+        self._clients: Dict[tuple, Any] = {}
+        self._client_lock = threading.Lock()
+        
+        # Keep-alive and a pool large enough for concurrent region sweeps
+        self._botocore_config = BotocoreConfig(
+            tcp_keepalive=True,
+            max_pool_connections=50,
+            retries={"max_attempts": 3, "mode": "adaptive"}
+        ) if BOTO3_AVAILABLE else None
+        
+        # (service, operation, params, region, profile) -> (timestamp, result)
+        self._cache: Dict[tuple, tuple] = {}
+        self._cache_lock = threading.Lock()
+        if BOTO3_AVAILABLE:
+            try:
+                self._session = self._get_session(self.profile)
+            except BotoCoreError:
+                pass  # reported by the first execute_command call
+    
+    def _get_session(self, profile: str):
+        """Return the boto3 session for a profile, creating it once"""
+        session = self._sessions.get(profile)
+        if session is None:
+            # No explicit 'default' so env/instance credentials work without ~/.aws/config
+            session = boto3.Session(profile_name=None if profile == 'default' else profile,
+                                    region_name=self.default_region)
+            self._sessions[profile] = session
+        return session
+    
+    def _get_client(self, service: str, region: str, profile: str):
+        """Return a cached boto3 client"""
+        key = (service, region, profile)
+        client = self._clients.get(key)
+        if client is None:
+            # Sessions aren't thread-safe for client creation; clients are
+            with self._client_lock:
+                client = self._clients.get(key)
+                if client is None:
+                    session = self._get_session(profile)
+                    client = self._clients[key] = session.client(
+                        _BOTO3_SERVICE_NAMES.get(service, service), region_name=region,
+                        config=self._botocore_config)
+        return client
     
-    def _check_aws_cli(self) -> bool:
-        """Check if AWS CLI is available"""
+    def _boto3_request(self, service: str, operation: str, parameters: Optional[Dict[str, Any]],
+                       region: str, profile: str):
+        """Resolve (client, method name, kwargs) for a CLI-style call
+        
+        Returns None when boto3 can't express it: a service or verb only the CLI
+        has (e.g. "s3 ls"), or parameters that don't map onto the API's input.
+        """
         try:
-            result = subprocess.run(['aws', '--version'], capture_output=True, text=True, timeout=5)
-            return result.returncode == 0
-        except:
-            return False
+            client = self._get_client(service, region, profile)
+        except UnknownServiceError:
+            return None
+        op = operation.replace('-', '_')
+        api_name = client.meta.method_to_api_mapping.get(op)
+        if api_name is None:
+            return None
+        input_shape = client.meta.service_model.operation_model(api_name).input_shape
+        try:
+            params = _to_boto3_params(parameters or {}, input_shape)
+        except (ValueError, TypeError):
+            return None
+        return client, op, params
+    
+    def _execute_boto3(self, service: str, operation: str, parameters: Optional[Dict[str, Any]],
+                       region: str, profile: str) -> Optional[Dict[str, Any]]:
+        """Execute an AWS API call in-process through boto3
+        
+        Paginated operations are followed to the end and merged, like the CLI does.
+        Returns None when the call can't be made through boto3 (see _boto3_request).
+        """
+        op = operation.replace('-', '_')
+        command = f"boto3 {service}.{op}"
+        try:
+            request = self._boto3_request(service, operation, parameters, region, profile)
+            if request is None:
+                return None
+            client, op, params = request
+            if client.can_paginate(op):
+                response = client.get_paginator(op).paginate(**params).build_full_result()
+            else:
+                response = getattr(client, op)(**params)
+            return {
+                "success": True,
+                "data": _to_cli_json(response),
+                "command": command
+            }
+        except (BotoCoreError, ClientError) as e:
+            return {"success": False, "error": str(e), "command": command}
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+    
+    def iter_pages(self, service: str, operation: str, parameters: Dict[str, Any] = None,
+                   region: str = None, profile: str = None):
+        """Yield response pages one at a time as they arrive
+        
+        Uses a boto3 paginator when the operation supports one; otherwise yields
+        the single execute_command result. Raises RuntimeError on failure.
+        """
+        region = region or self.default_region
+        profile = profile or self.profile
+        if BOTO3_AVAILABLE:
+            # Client creation (profile, credentials, region) can fail too
+            try:
+                request = self._boto3_request(service, operation, parameters, region, profile)
+                if request is not None and request[0].can_paginate(request[1]):
+                    client, op, params = request
+                    for page in client.get_paginator(op).paginate(**params):
+                        yield _to_cli_json(page)
+                    return
+            except (BotoCoreError, ClientError) as e:
+                raise RuntimeError(str(e)) from e
+        
+        result = self.execute_command(service, operation, parameters, region, profile)
+        if not result["success"]:
+            raise RuntimeError(result["error"])
+        yield result["data"]
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _check_aws_cli() -> bool:
+        """Check if AWS CLI is available (a PATH lookup, no subprocess)"""
+        return shutil.which('aws') is not None
     
     def execute_command(self, service: str, operation: str, parameters: Dict[str, Any] = None, 
                        region: str = None, profile: str = None) -> Dict[str, Any]:
-        """Execute AWS CLI command"""
+        """Execute an AWS command through boto3, or the aws CLI if boto3 is missing
+        
+        Successful read-only operations (list-/describe-/get-) are cached for _CACHE_TTL
+        seconds; any other successful operation drops the service's cached results.
+        """
         if not self.aws_cli_available:
             return {"success": False, "error": "AWS CLI not available"}
         
+        region = region or self.default_region
+        profile = profile or self.profile
+        key = None
+        if operation.startswith(_CACHEABLE_PREFIXES):
+            key = (service, operation,
+                   json.dumps(parameters, sort_keys=True, default=str) if parameters else '',
+                   region, profile)
+            with self._cache_lock:
+                cached = self._cache.get(key)
+            if cached and time.monotonic() - cached[0] < _CACHE_TTL:
+                return cached[1]
+        
+        result = None
+        if BOTO3_AVAILABLE:
+            result = self._execute_boto3(service, operation, parameters, region, profile)
+        if result is None:
+            # CLI-only commands and parameters boto3 can't take go to the CLI as typed
+            if self._check_aws_cli():
+                result = self._execute_cli(service, operation, parameters, region, profile)
+            else:
+                result = {
+                    "success": False,
+                    "error": f"'{service} {operation}' needs the AWS CLI, which is not installed"
+                }
+        
+        if result["success"]:
+            if key is not None:
+                with self._cache_lock:
+                    self._cache[key] = (time.monotonic(), result)
+            else:
+                # A mutation (stop-instances, create-bucket, ...) makes cached listings stale
+                self.invalidate(service)
+        return result
+    
+    def invalidate(self, service: str = None):
+        """Drop cached results for one service, or all of them"""
+        with self._cache_lock:
+            if service is None:
+                self._cache.clear()
+            else:
+                # s3 and s3api share one API, so they share invalidation
+                target = _BOTO3_SERVICE_NAMES.get(service, service)
+                for key in [k for k in self._cache
+                            if _BOTO3_SERVICE_NAMES.get(k[0], k[0]) == target]:
+                    del self._cache[key]
+    
+    def _execute_cli(self, service: str, operation: str, parameters: Optional[Dict[str, Any]],
+                     region: str, profile: str) -> Dict[str, Any]:
+        """Execute an AWS command through the aws CLI"""
         try:
             # Build command
             cmd = ['aws', service, operation]
             
             # Add region
-            if region or self.default_region:
-                cmd.extend(['--region', region or self.default_region])
+            if region:
+                cmd.extend(['--region', region])
             
             # Add profile
-            if profile or self.profile:
-                cmd.extend(['--profile', profile or self.profile])
+            if profile:
+                cmd.extend(['--profile', profile])
             
             # Add parameters
             if parameters:
@@ -54,6 +393,10 @@ class AWSCLIManager:
             # Add JSON output
             cmd.extend(['--output', 'json'])
             
+            list_key = _STREAM_LIST_KEYS.get(operation)
+            if IJSON_AVAILABLE and list_key:
+                return self._stream_cli(cmd, list_key)
+            
             # Execute command
             result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
             
@@ -80,6 +423,48 @@ class AWSCLIManager:
         except Exception as e:
             return {"success": False, "error": str(e)}
     
+    def _stream_cli(self, cmd: List[str], list_key: str) -> Dict[str, Any]:
+        """Run a listing command, parsing its items straight off the stdout pipe
+        
+        The raw output is never held in memory as one string; only the parsed
+        items under list_key are kept (other top-level keys are dropped).
+        """
+        with tempfile.TemporaryFile() as stderr:
+            proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr)
+            timer = threading.Timer(30, proc.kill)
+            timer.start()
+            try:
+                try:
+                    items = list(ijson.items(proc.stdout, f'{list_key}.item', use_float=True))
+                except ijson.JSONError:
+                    items = None
+                proc.stdout.close()
+                returncode = proc.wait()
+            finally:
+                timer.cancel()
+            
+            if returncode == -signal.SIGKILL:
+                return {"success": False, "error": "Command timed out"}
+            if returncode != 0:
+                stderr.seek(0)
+                return {
+                    "success": False,
+                    "error": stderr.read().decode(errors='replace').strip(),
+                    "command": " ".join(cmd)
+                }
+        
+        if items is None:
+            return {
+                "success": False,
+                "error": "Could not parse AWS CLI output",
+                "command": " ".join(cmd)
+            }
+        return {
+            "success": True,
+            "data": {list_key: items},
+            "command": " ".join(cmd)
+        }
+    
     def list_s3_buckets(self) -> Dict[str, Any]:
         """List S3 buckets"""
         return self.execute_command('s3api', 'list-buckets')
@@ -163,15 +548,17 @@ class AWSIntegration:
         if not buckets:
             return "🪣 No S3 buckets found"
         
-        response = f"🪣 S3 Buckets ({len(buckets)}):\n\n"
+        parts = [f"🪣 S3 Buckets ({len(buckets)}):\n\n"]
         
         for bucket in buckets:
             name = bucket.get("Name", "Unknown")
-            created = bucket.get("CreationDate", "Unknown")[:10]
-            response += f"• **{name}**\n"
-            response += f"  📅 Created: {created}\n\n"
+            created = _iso_date(bucket.get("CreationDate", "Unknown"))
+            parts.append(
+                f"• **{name}**\n"
+                f"  📅 Created: {created}\n\n"
+            )
         
-        return response
+        return "".join(parts)
     
     def ec2_instances(self, region: str = None) -> str:
         """List EC2 instances"""
@@ -181,34 +568,32 @@ class AWSIntegration:
             return f"❌ Failed to list EC2 instances: {result['error']}"
         
         reservations = result["data"].get("Reservations", [])
-        instances = []
-        
-        for reservation in reservations:
-            instances.extend(reservation.get("Instances", []))
+        instances = [i for r in reservations for i in r.get("Instances", [])]
         
+        return self._format_ec2_instances(instances, region or self.aws_manager.default_region)
+    
+    def _format_ec2_instances(self, instances: List[Dict[str, Any]], where: str) -> str:
+        """Format EC2 instances for display"""
         if not instances:
-            return f"🖥️ No EC2 instances found in {region or self.aws_manager.default_region}"
+            return f"🖥️ No EC2 instances found in {where}"
         
-        response = f"🖥️ EC2 Instances ({len(instances)}):\n\n"
+        parts = [f"🖥️ EC2 Instances ({len(instances)}):\n\n"]
         
         for instance in instances:
             instance_id = instance.get("InstanceId", "Unknown")
             instance_type = instance.get("InstanceType", "Unknown")
             state = instance.get("State", {}).get("Name", "Unknown")
             
-            # Get name tag
-            name = "No Name"
-            for tag in instance.get("Tags", []):
-                if tag.get("Key") == "Name":
-                    name = tag.get("Value", "No Name")
-                    break
+            name = {t.get("Key"): t.get("Value") for t in instance.get("Tags", [])}.get("Name") or "No Name"
             
-            state_icon = {"running": "🟢", "stopped": "🔴", "pending": "🟡", "stopping": "🟠"}.get(state, "⚪")
+            state_icon = _EC2_STATE_ICONS.get(state, "⚪")
             
-            response += f"{state_icon} **{name}** ({instance_id})\n"
-            response += f"  🔧 Type: {instance_type} | 📊 State: {state}\n\n"
+            parts.append(
+                f"{state_icon} **{name}** ({instance_id})\n"
+                f"  🔧 Type: {instance_type} | 📊 State: {state}\n\n"
+            )
         
-        return response
+        return "".join(parts)
     
     def lambda_functions(self, region: str = None) -> str:
         """List Lambda functions"""
@@ -217,24 +602,29 @@ class AWSIntegration:
         if not result["success"]:
             return f"❌ Failed to list Lambda functions: {result['error']}"
         
-        functions = result["data"].get("Functions", [])
-        
+        return self._format_lambda_functions(result["data"].get("Functions", []),
+                                             region or self.aws_manager.default_region)
+    
+    def _format_lambda_functions(self, functions: List[Dict[str, Any]], where: str) -> str:
+        """Format Lambda functions for display"""
         if not functions:
-            return f"⚡ No Lambda functions found in {region or self.aws_manager.default_region}"
+            return f"⚡ No Lambda functions found in {where}"
         
-        response = f"⚡ Lambda Functions ({len(functions)}):\n\n"
+        parts = [f"⚡ Lambda Functions ({len(functions)}):\n\n"]
         
         for func in functions:
             name = func.get("FunctionName", "Unknown")
             runtime = func.get("Runtime", "Unknown")
             size = func.get("CodeSize", 0)
-            modified = func.get("LastModified", "Unknown")[:10]
+            modified = _iso_date(func.get("LastModified", "Unknown"))
             
-            response += f"⚡ **{name}**\n"
-            response += f"  🔧 Runtime: {runtime} | 📦 Size: {size:,} bytes\n"
-            response += f"  📅 Modified: {modified}\n\n"
+            parts.append(
+                f"⚡ **{name}**\n"
+                f"  🔧 Runtime: {runtime} | 📦 Size: {size:,} bytes\n"
+                f"  📅 Modified: {modified}\n\n"
+            )
         
-        return response
+        return "".join(parts)
     
     def iam_users(self) -> str:
         """List IAM users"""
@@ -248,17 +638,19 @@ class AWSIntegration:
         if not users:
             return "👤 No IAM users found"
         
-        response = f"👤 IAM Users ({len(users)}):\n\n"
+        parts = [f"👤 IAM Users ({len(users)}):\n\n"]
         
         for user in users:
             name = user.get("UserName", "Unknown")
-            created = user.get("CreateDate", "Unknown")[:10]
+            created = _iso_date(user.get("CreateDate", "Unknown"))
             path = user.get("Path", "/")
             
-            response += f"👤 **{name}**\n"
-            response += f"  📁 Path: {path} | 📅 Created: {created}\n\n"
+            parts.append(
+                f"👤 **{name}**\n"
+                f"  📁 Path: {path} | 📅 Created: {created}\n\n"
+            )
         
-        return response
+        return "".join(parts)
     
     def vpcs(self, region: str = None) -> str:
         """List VPCs"""
@@ -267,12 +659,14 @@ class AWSIntegration:
         if not result["success"]:
             return f"❌ Failed to list VPCs: {result['error']}"
         
-        vpcs = result["data"].get("Vpcs", [])
-        
+        return self._format_vpcs(result["data"].get("Vpcs", []), region or self.aws_manager.default_region)
+    
+    def _format_vpcs(self, vpcs: List[Dict[str, Any]], where: str) -> str:
+        """Format VPCs for display"""
         if not vpcs:
-            return f"🌐 No VPCs found in {region or self.aws_manager.default_region}"
+            return f"🌐 No VPCs found in {where}"
         
-        response = f"🌐 VPCs ({len(vpcs)}):\n\n"
+        parts = [f"🌐 VPCs ({len(vpcs)}):\n\n"]
         
         for vpc in vpcs:
             vpc_id = vpc.get("VpcId", "Unknown")
@@ -280,20 +674,17 @@ class AWSIntegration:
             state = vpc.get("State", "Unknown")
             is_default = vpc.get("IsDefault", False)
             
-            # Get name tag
-            name = "No Name"
-            for tag in vpc.get("Tags", []):
-                if tag.get("Key") == "Name":
-                    name = tag.get("Value", "No Name")
-                    break
+            name = {t.get("Key"): t.get("Value") for t in vpc.get("Tags", [])}.get("Name") or "No Name"
             
-            default_icon = "⭐" if is_default else "🌐"
-            state_icon = {"available": "🟢", "pending": "🟡"}.get(state, "⚪")
+            default_icon = _VPC_DEFAULT_ICONS[bool(is_default)]
+            state_icon = _VPC_STATE_ICONS.get(state, "⚪")
             
-            response += f"{default_icon} {state_icon} **{name}** ({vpc_id})\n"
-            response += f"  📡 CIDR: {cidr} | 📊 State: {state}\n\n"
+            parts.append(
+                f"{default_icon} {state_icon} **{name}** ({vpc_id})\n"
+                f"  📡 CIDR: {cidr} | 📊 State: {state}\n\n"
+            )
         
-        return response
+        return "".join(parts)
     
     def cloudformation_stacks(self, region: str = None) -> str:
         """List CloudFormation stacks"""
@@ -302,31 +693,29 @@ class AWSIntegration:
         if not result["success"]:
             return f"❌ Failed to list CloudFormation stacks: {result['error']}"
         
-        stacks = result["data"].get("StackSummaries", [])
-        
+        return self._format_cloudformation_stacks(result["data"].get("StackSummaries", []),
+                                                  region or self.aws_manager.default_region)
+    
+    def _format_cloudformation_stacks(self, stacks: List[Dict[str, Any]], where: str) -> str:
+        """Format CloudFormation stacks for display"""
         if not stacks:
-            return f"📚 No CloudFormation stacks found in {region or self.aws_manager.default_region}"
+            return f"📚 No CloudFormation stacks found in {where}"
         
-        response = f"📚 CloudFormation Stacks ({len(stacks)}):\n\n"
+        parts = [f"📚 CloudFormation Stacks ({len(stacks)}):\n\n"]
         
         for stack in stacks:
             name = stack.get("StackName", "Unknown")
             status = stack.get("StackStatus", "Unknown")
-            created = stack.get("CreationTime", "Unknown")
-            if isinstance(created, str):
-                created = created[:10]
+            created = _iso_date(stack.get("CreationTime", "Unknown"))
             
-            status_icon = {
-                "CREATE_COMPLETE": "✅",
-                "UPDATE_COMPLETE": "🔄",
-                "DELETE_COMPLETE": "🗑️",
-                "ROLLBACK_COMPLETE": "↩️"
-            }.get(status, "⚪")
+            status_icon = _CFN_STATUS_ICONS.get(status, "⚪")
             
-            response += f"{status_icon} **{name}**\n"
-            response += f"  📊 Status: {status} | 📅 Created: {created}\n\n"
+            parts.append(
+                f"{status_icon} **{name}**\n"
+                f"  📊 Status: {status} | 📅 Created: {created}\n\n"
+            )
         
-        return response
+        return "".join(parts)
     
     def rds_instances(self, region: str = None) -> str:
         """List RDS instances"""
@@ -335,12 +724,15 @@ class AWSIntegration:
         if not result["success"]:
             return f"❌ Failed to list RDS instances: {result['error']}"
         
-        instances = result["data"].get("DBInstances", [])
-        
+        return self._format_rds_instances(result["data"].get("DBInstances", []),
+                                          region or self.aws_manager.default_region)
+    
+    def _format_rds_instances(self, instances: List[Dict[str, Any]], where: str) -> str:
+        """Format RDS instances for display"""
         if not instances:
-            return f"🗄️ No RDS instances found in {region or self.aws_manager.default_region}"
+            return f"🗄️ No RDS instances found in {where}"
         
-        response = f"🗄️ RDS Instances ({len(instances)}):\n\n"
+        parts = [f"🗄️ RDS Instances ({len(instances)}):\n\n"]
         
         for instance in instances:
             name = instance.get("DBInstanceIdentifier", "Unknown")
@@ -348,14 +740,89 @@ class AWSIntegration:
             status = instance.get("DBInstanceStatus", "Unknown")
             instance_class = instance.get("DBInstanceClass", "Unknown")
             
-            status_icon = {"available": "🟢", "stopped": "🔴", "starting": "🟡"}.get(status, "⚪")
+            status_icon = _RDS_STATUS_ICONS.get(status, "⚪")
             
-            response += f"{status_icon} **{name}**\n"
-            response += f"  🔧 Engine: {engine} | 💻 Class: {instance_class}\n"
-            response += f"  📊 Status: {status}\n\n"
+            parts.append(
+                f"{status_icon} **{name}**\n"
+                f"  🔧 Engine: {engine} | 💻 Class: {instance_class}\n"
+                f"  📊 Status: {status}\n\n"
+            )
         
+        return "".join(parts)
+    
+    def _gather_regions(self, fetch, regions: List[str]):
+        """Run fetch(region) for every region concurrently
+        
+        Returns (data dicts of successful regions, error line per failed region).
+        """
+        futures = {_REGION_EXECUTOR.submit(fetch, region): region for region in regions}
+        results, errors = [], []
+        for future in as_completed(futures):
+            result = future.result()
+            if result["success"]:
+                results.append(result["data"])
+            else:
+                errors.append(f"⚠️ {futures[future]}: {result['error']}")
+        return results, errors
+    
+    def _all_regions(self, fetch, regions: List[str], extract, formatter, label: str) -> str:
+        """Sweep regions concurrently, merge the items and format them once"""
+        results, errors = self._gather_regions(fetch, regions)
+        if errors and not results:
+            return f"❌ Failed to list {label}:\n" + "\n".join(errors)
+        
+        items = [item for data in results for item in extract(data)]
+        response = formatter(items, f"{len(regions)} regions")
+        if errors:
+            response += "\n".join(errors) + "\n"
         return response
     
+    def ec2_instances_all_regions(self, regions: List[str]) -> str:
+        """List EC2 instances across several regions"""
+        return self._all_regions(
+            self.aws_manager.list_ec2_instances, regions,
+            lambda data: [i for r in data.get("Reservations", []) for i in r.get("Instances", [])],
+            self._format_ec2_instances, "EC2 instances")
+    
+    def lambda_functions_all_regions(self, regions: List[str]) -> str:
+        """List Lambda functions across several regions"""
+        return self._all_regions(
+            self.aws_manager.list_lambda_functions, regions,
+            lambda data: data.get("Functions", []),
+            self._format_lambda_functions, "Lambda functions")
+    
+    def rds_instances_all_regions(self, regions: List[str]) -> str:
+        """List RDS instances across several regions"""
+        return self._all_regions(
+            self.aws_manager.list_rds_instances, regions,
+            lambda data: data.get("DBInstances", []),
+            self._format_rds_instances, "RDS instances")
+    
+    def vpcs_all_regions(self, regions: List[str]) -> str:
+        """List VPCs across several regions"""
+        return self._all_regions(
+            self.aws_manager.describe_vpcs, regions,
+            lambda data: data.get("Vpcs", []),
+            self._format_vpcs, "VPCs")
+    
+    def cloudformation_stacks_all_regions(self, regions: List[str]) -> str:
+        """List CloudFormation stacks across several regions"""
+        return self._all_regions(
+            self.aws_manager.list_cloudformation_stacks, regions,
+            lambda data: data.get("StackSummaries", []),
+            self._format_cloudformation_stacks, "CloudFormation stacks")
+    
+    def full_status(self, region: str = None) -> str:
+        """S3, EC2, Lambda, RDS and CloudFormation summaries fetched concurrently"""
+        futures = [
+            _REGION_EXECUTOR.submit(self.s3_buckets),
+            _REGION_EXECUTOR.submit(self.ec2_instances, region),
+            _REGION_EXECUTOR.submit(self.lambda_functions, region),
+            _REGION_EXECUTOR.submit(self.rds_instances, region),
+            _REGION_EXECUTOR.submit(self.cloudformation_stacks, region),
+        ]
+        return "\n".join(future.result() for future in futures)
+    
     def execute_custom(self, service: str, operation: str, **params) -> str:
         """Execute custom AWS CLI command"""
         result = self.aws_manager.execute_command(service, operation, params)
@@ -366,10 +833,16 @@ class AWSIntegration:
         response = f"☁️ AWS {service} {operation}\n\n"
         
         if isinstance(result["data"], dict) and result["data"]:
-            # Format JSON output
-            formatted = json.dumps(result["data"], indent=2)
+            # Format JSON output, trimming first since only 1000 chars are shown
+            trimmed, truncated = _trim_for_display(result["data"])
+            if ORJSON_AVAILABLE:
+                formatted = orjson.dumps(trimmed, option=orjson.OPT_INDENT_2, default=str).decode()
+            else:
+                formatted = json.dumps(trimmed, indent=2, default=str)
             if len(formatted) > 1000:
                 response += formatted[:1000] + "\n... (truncated)"
+            elif truncated:
+                response += formatted + "\n... (truncated)"
             else:
                 response += formatted
         else:
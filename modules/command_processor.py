@@ -1,16 +1,52 @@
 import json
 import re
-from modules.window_manager import WindowManager
-from modules.application_manager import ApplicationManager
-from modules.file_system_manager import FileSystemManager
-from modules.system_monitor import SystemMonitor
+import time
+from collections import Counter
+from functools import cached_property, wraps
+
+# Literal leading word of a pattern, e.g. 'launch' in r'launch (\w+)'
+_RE_LITERAL_FIRST_WORD = re.compile(r'^([a-z]+)(?: |$)')
+
+def _build_dispatch(entries):
+    """Combine (regex, handler) pairs into one alternation
+    
+    Each pattern is wrapped in a named group. The wrapper closes last, so
+    match.lastindex identifies the pattern; the returned dict maps that group
+    number to (handler, first argument group, end argument group).
+    """
+    parts = []
+    handlers = {}
+    group = 1
+    for i, (regex, handler) in enumerate(entries):
+        parts.append(f'(?P<g{i}>{regex.pattern})')
+        handlers[group] = (handler, group + 1, group + 1 + regex.groups)
+        group += 1 + regex.groups
+    return re.compile('|'.join(parts)), handlers
+
+# How long system readings are reused for repeated queries
+SYSTEM_INFO_TTL = 2.0
+
+def ttl_cache(seconds):
+    """Cache a no-argument handler's successful result on the instance for `seconds`"""
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self):
+            cache = self._ttl_cache
+            now = time.monotonic()
+            hit = cache.get(method.__name__)
+            if hit and now - hit[0] < seconds:
+                return hit[1]
+            result = method(self)
+            if result[0]:
+                cache[method.__name__] = (now, result)
+            return result
+        return wrapper
+    return decorator
 
 class CommandProcessor:
     def __init__(self):
-        self.window_manager = WindowManager()
-        self.app_manager = ApplicationManager()
-        self.file_manager = FileSystemManager()
-        self.system_monitor = SystemMonitor()
+        # handler name -> (timestamp, result) for ttl_cache'd system queries
+        self._ttl_cache = {}
         
         # Advanced command patterns
         self.command_patterns = {
@@ -51,26 +87,80 @@ class CommandProcessor:
                 r'running processes': self.get_processes,
                 r'uptime': self.get_uptime,
                 r'temperature': self.get_temperature,
+                r'refresh (?:system|stats)': self.refresh_system_info,
             }
         }
+        
+        # Compile once, keeping the category grouping
+        self.command_patterns = {
+            category: [(re.compile(pattern), handler) for pattern, handler in patterns.items()]
+            for category, patterns in self.command_patterns.items()
+        }
+        
+        # All patterns as one alternation, in priority order
+        entries = [entry for patterns in self.command_patterns.values() for entry in patterns]
+        self._combined, self._handlers = _build_dispatch(entries)
+        
+        # Utterances usually start with the command word, so index the patterns by
+        # their literal first word. Patterns without one could match anywhere and
+        # go into every bucket.
+        by_word = {}
+        for regex, handler in entries:
+            literal = _RE_LITERAL_FIRST_WORD.match(regex.pattern)
+            if literal:
+                by_word.setdefault(literal.group(1), [])
+        for regex, handler in entries:
+            literal = _RE_LITERAL_FIRST_WORD.match(regex.pattern)
+            for word, bucket in by_word.items():
+                if not literal or literal.group(1) == word:
+                    bucket.append((regex, handler))
+        self._first_word_index = {word: _build_dispatch(bucket) for word, bucket in by_word.items()}
     
     def process_command(self, user_input):
         """Process natural language commands"""
         user_input = user_input.lower().strip()
         
-        for category, patterns in self.command_patterns.items():
-            for pattern, handler in patterns.items():
-                match = re.search(pattern, user_input)
-                if match:
-                    try:
-                        if match.groups():
-                            return handler(*match.groups())
-                        else:
-                            return handler()
-                    except Exception as e:
-                        return False, f"Error executing command: {e}"
+        # A match at position 0 is what the full search would pick first, so try
+        # the first word's bucket before scanning with every pattern
+        words = user_input.split(None, 1)
+        combined, handlers = self._first_word_index.get(words[0] if words else '', (None, None))
+        match = combined.match(user_input) if combined else None
+        if not match:
+            combined, handlers = self._combined, self._handlers
+            match = combined.search(user_input)
+            if not match:
+                return None  # No pattern matched
         
-        return None  # No pattern matched
+        handler, first, end = handlers[match.lastindex]
+        args = [match.group(g) for g in range(first, end)]
+        try:
+            if args:
+                return handler(*args)
+            else:
+                return handler()
+        except Exception as e:
+            return False, f"Error executing command: {e}"
+    
+    # Managers are imported and created on first use
+    @cached_property
+    def window_manager(self):
+        from modules.window_manager import WindowManager
+        return WindowManager()
+    
+    @cached_property
+    def app_manager(self):
+        from modules.application_manager import ApplicationManager
+        return ApplicationManager()
+    
+    @cached_property
+    def file_manager(self):
+        from modules.file_system_manager import FileSystemManager
+        return FileSystemManager()
+    
+    @cached_property
+    def system_monitor(self):
+        from modules.system_monitor import SystemMonitor
+        return SystemMonitor()
     
     # Window Management Commands
     def close_window(self):
@@ -165,18 +255,23 @@ class CommandProcessor:
     def list_files(self):
         success, items = self.file_manager.list_directory()
         if success:
-            file_count = len([i for i in items if i['type'] == 'file'])
-            dir_count = len([i for i in items if i['type'] == 'dir'])
-            return True, f"Found {file_count} files and {dir_count} directories"
+            counts = Counter(i['type'] for i in items)
+            return True, f"Found {counts['file']} files and {counts['dir']} directories"
         return success, items
     
     # System Information Commands
+    def refresh_system_info(self):
+        self._ttl_cache.clear()
+        return True, "System information will be refreshed"
+    
+    @ttl_cache(SYSTEM_INFO_TTL)
     def get_cpu_info(self):
         info = self.system_monitor.get_cpu_info()
         if 'error' not in info:
             return True, f"CPU usage: {info['usage_percent']:.1f}% ({info['core_count']} cores)"
         return False, info['error']
     
+    @ttl_cache(SYSTEM_INFO_TTL)
     def get_memory_info(self):
         info = self.system_monitor.get_memory_info()
         if 'error' not in info:
@@ -184,6 +279,7 @@ class CommandProcessor:
             return True, f"Memory: {mem['percent']:.1f}% used ({mem['used']//1024//1024//1024}GB/{mem['total']//1024//1024//1024}GB)"
         return False, info['error']
     
+    @ttl_cache(SYSTEM_INFO_TTL)
     def get_disk_info(self):
         info = self.system_monitor.get_disk_info()
         if isinstance(info, list) and info:
@@ -191,6 +287,7 @@ class CommandProcessor:
             return True, f"Disk: {main_disk['percent']:.1f}% used ({main_disk['used']//1024//1024//1024}GB/{main_disk['total']//1024//1024//1024}GB)"
         return False, "Could not get disk information"
     
+    @ttl_cache(SYSTEM_INFO_TTL)
     def get_system_summary(self):
         summary = self.system_monitor.get_system_summary()
         if 'error' not in summary:
@@ -199,18 +296,21 @@ class CommandProcessor:
             return True, f"System Status - CPU: {cpu:.1f}%, Memory: {mem:.1f}%"
         return False, summary['error']
     
+    @ttl_cache(SYSTEM_INFO_TTL)
     def get_processes(self):
         processes = self.system_monitor.get_process_list(5)
         if isinstance(processes, list):
             return True, f"Top 5 processes by CPU usage: {', '.join([p['name'] for p in processes[:5]])}"
         return False, "Could not get process list"
     
+    @ttl_cache(SYSTEM_INFO_TTL)
     def get_uptime(self):
         uptime = self.system_monitor.get_system_uptime()
         if 'error' not in uptime:
             return True, f"System uptime: {uptime['formatted']}"
         return False, uptime['error']
     
+    @ttl_cache(SYSTEM_INFO_TTL)
     def get_temperature(self):
         temp = self.system_monitor.get_temperature()
         if 'error' not in temp:
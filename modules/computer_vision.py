@@ -2,7 +2,8 @@ import cv2
 import numpy as np
 import subprocess
 import time
-from threading import Thread
+from collections import Counter, deque
+from threading import Event, Lock, Thread, current_thread
 
 # Try to import GUI-dependent modules
 try:
@@ -13,25 +14,120 @@ except Exception as e:
     print(f"GUI modules not available: {e}")
     GUI_AVAILABLE = False
 
+# Optional JIT for the per-frame gesture classifier
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Capture size requested from the camera (map_hand_to_cursor assumes it)
+CAMERA_WIDTH = 640
+CAMERA_HEIGHT = 480
+# Frame size handed to MediaPipe; landmarks come back normalized to [0, 1]
+HAND_INPUT_SIZE = (256, 256)
+# analyze_screen looks for edges on a screenshot shrunk by this factor
+SCREEN_ANALYSIS_SCALE = 4
+# Motion gate: thumbnail size and mean per-pixel gray change that counts as motion
+MOTION_THUMB_SIZE = (80, 60)
+MOTION_THRESHOLD = 2.0
+
+# Gesture labels indexed by the code _gesture_code returns
+GESTURES = (None, "point", "peace", "thumbs_up", "fist", "open_hand")
+
+def _gesture_code(points):
+    """Classify an (N, 2) landmark array into an index of GESTURES"""
+    # Finger tip above its MCP joint means extended; thumb extends horizontally
+    index_up = points[8, 1] < points[5, 1]
+    middle_up = points[12, 1] < points[9, 1]
+    thumb_up = points[4, 0] > points[2, 0]
+    
+    if index_up and not middle_up:
+        return 1
+    elif index_up and middle_up:
+        return 2
+    elif thumb_up and index_up:
+        return 3
+    elif not index_up and not middle_up:
+        return 4
+    return 5
+
+if NUMBA_AVAILABLE:
+    _gesture_code = njit(cache=True)(_gesture_code)
+
+class FrameGrabber:
+    """Reads camera frames on a background thread, keeping only the latest"""
+    def __init__(self, camera):
+        self.camera = camera
+        self.frame = None
+        self.stopped = False
+        self.lock = Lock()
+        self.new_frame = Event()
+        self.thread = None
+        
+    def start(self):
+        """Start reading frames in a daemon thread"""
+        self.thread = Thread(target=self._update)
+        self.thread.daemon = True
+        self.thread.start()
+        return self
+    
+    def _update(self):
+        while not self.stopped:
+            ret, frame = self.camera.read()
+            if not ret:
+                self.stopped = True
+                break
+            # Single slot: a newer frame simply replaces an unconsumed one
+            with self.lock:
+                self.frame = frame
+            self.new_frame.set()
+        self.new_frame.set()
+    
+    def read(self, timeout=1.0):
+        """Return the newest frame not yet handed out, or None if none arrived in time
+        
+        None alone doesn't mean the stream ended; check `stopped` for that.
+        """
+        if not self.new_frame.wait(timeout):
+            return None
+        with self.lock:
+            frame, self.frame = self.frame, None
+            self.new_frame.clear()
+        return frame
+    
+    def stop(self):
+        """Stop reading and wait until the reader is out of camera.read()"""
+        self.stopped = True
+        if self.thread is not None and self.thread is not current_thread():
+            self.thread.join()
+
 class ComputerVision:
     def __init__(self):
         if not GUI_AVAILABLE:
             print("⚠️ Computer vision running in limited mode - no GUI access")
             return
             
-        # Initialize MediaPipe
+        # Initialize MediaPipe; the Hands graph is created on first use and
+        # released when gesture control stops
         self.mp_hands = mp.solutions.hands
         self.mp_drawing = mp.solutions.drawing_utils
-        self.hands = self.mp_hands.Hands(
-            static_image_mode=False,
-            max_num_hands=2,
-            min_detection_confidence=0.7,
-            min_tracking_confidence=0.5
-        )
+        self.hands = None
+        
+        # Reused per-frame buffers for the downscaled BGR and RGB hand input
+        input_w, input_h = HAND_INPUT_SIZE
+        self._small_buf = np.empty((input_h, input_w, 3), dtype=np.uint8)
+        self._rgb_buf = np.empty_like(self._small_buf)
+        self._prev_gray = None
+        # Last analyzed frame's pixel landmarks and MediaPipe landmark lists,
+        # reused on frames the motion gate skips
+        self._last_landmarks = []
+        self._last_drawn = []
         
         # Gesture recognition
-        self.gesture_buffer = []
         self.gesture_threshold = 5
+        self.gesture_buffer = deque(maxlen=self.gesture_threshold)
+        self.gesture_counts = Counter()  # Running tally of gesture_buffer
         self.last_gesture = None
         self.gesture_cooldown = 0
         
@@ -41,9 +137,15 @@ class ComputerVision:
         except:
             self.screen_width, self.screen_height = 1920, 1080  # Default
         
+        # Cursor control: camera-to-screen scale and the last position we moved to
+        self._cam_to_screen_x = self.screen_width / CAMERA_WIDTH
+        self._cam_to_screen_y = self.screen_height / CAMERA_HEIGHT
+        self._last_cursor = None
+        
         # Camera
         self.camera = None
         self.camera_active = False
+        self._grabber = None
         
     def start_camera(self):
         """Start camera feed"""
@@ -54,6 +156,16 @@ class ComputerVision:
             self.camera = cv2.VideoCapture(0)
             if not self.camera.isOpened():
                 return False, "Could not open camera"
+            
+            # Keep only the newest frame buffered and ask for MJPEG at a fixed size
+            for prop, value, name in (
+                (cv2.CAP_PROP_BUFFERSIZE, 1, "buffer size"),
+                (cv2.CAP_PROP_FRAME_WIDTH, CAMERA_WIDTH, "frame width"),
+                (cv2.CAP_PROP_FRAME_HEIGHT, CAMERA_HEIGHT, "frame height"),
+                (cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'), "MJPEG format"),
+            ):
+                if not self.camera.set(prop, value):
+                    print(f"⚠️ Camera does not support setting {name}")
             self.camera_active = True
             return True, "Camera started"
         except Exception as e:
@@ -62,6 +174,10 @@ class ComputerVision:
     def stop_camera(self):
         """Stop camera feed"""
         self.camera_active = False
+        # The grabber must be out of camera.read() before the capture is released
+        grabber = getattr(self, '_grabber', None)
+        if grabber is not None:
+            grabber.stop()
         if self.camera:
             self.camera.release()
         cv2.destroyAllWindows()
@@ -86,65 +202,73 @@ class ComputerVision:
         except Exception as e:
             return False, f"Screenshot failed: {e}"
     
+    def _create_hands(self):
+        return self.mp_hands.Hands(
+            static_image_mode=False,
+            max_num_hands=2,
+            model_complexity=0,  # Lite landmark model, plenty for coarse gestures
+            min_detection_confidence=0.7,
+            min_tracking_confidence=0.5
+        )
+    
+    def release_hands(self):
+        """Free the MediaPipe Hands models until they are needed again"""
+        if getattr(self, 'hands', None) is not None:
+            self.hands.close()
+            self.hands = None
+    
     def detect_hands(self, frame):
         """Detect hands in frame"""
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = self.hands.process(rgb_frame)
+        if self.hands is None:
+            self.hands = self._create_hands()
+        cv2.resize(frame, HAND_INPUT_SIZE, dst=self._small_buf, interpolation=cv2.INTER_AREA)
+        cv2.cvtColor(self._small_buf, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+        results = self.hands.process(self._rgb_buf)
         
         hand_landmarks = []
         if results.multi_hand_landmarks:
+            h, w, _ = frame.shape
+            scale = np.array([w, h], dtype=np.float32)
             for landmarks in results.multi_hand_landmarks:
-                # Convert landmarks to pixel coordinates
-                h, w, _ = frame.shape
-                landmark_points = []
-                for lm in landmarks.landmark:
-                    x, y = int(lm.x * w), int(lm.y * h)
-                    landmark_points.append((x, y))
-                hand_landmarks.append(landmark_points)
+                # Convert landmarks to an (N, 2) array of full-frame pixel coordinates
+                lm = landmarks.landmark
+                coords = np.fromiter((c for p in lm for c in (p.x, p.y)),
+                                     dtype=np.float32, count=2 * len(lm)).reshape(-1, 2)
+                hand_landmarks.append((coords * scale).astype(np.int32))
                 
                 # Draw landmarks
                 self.mp_drawing.draw_landmarks(
                     frame, landmarks, self.mp_hands.HAND_CONNECTIONS)
         
+        self._last_landmarks = hand_landmarks
+        self._last_drawn = list(results.multi_hand_landmarks or [])
         return frame, hand_landmarks
     
+    def reuse_last_hands(self, frame):
+        """Draw the previous detection onto frame and return it, without inference"""
+        for landmarks in self._last_drawn:
+            self.mp_drawing.draw_landmarks(
+                frame, landmarks, self.mp_hands.HAND_CONNECTIONS)
+        return frame, self._last_landmarks
+    
+    def _frame_changed(self, frame):
+        """Cheap check whether frame differs enough from the last analyzed one"""
+        thumb = cv2.resize(frame, MOTION_THUMB_SIZE, interpolation=cv2.INTER_AREA)
+        gray = cv2.cvtColor(thumb, cv2.COLOR_BGR2GRAY)
+        if self._prev_gray is not None and \
+                cv2.absdiff(gray, self._prev_gray).mean() < MOTION_THRESHOLD:
+            return False
+        # Only analyzed frames become the reference, so slow drift still adds up
+        self._prev_gray = gray
+        return True
+    
     def recognize_gesture(self, landmarks):
         """Recognize hand gestures"""
         if not landmarks:
             return None
             
-        # Get first hand landmarks
-        points = landmarks[0]
-        
-        # Simple gesture recognition based on finger positions
-        # Index finger tip and MCP
-        index_tip = points[8]
-        index_mcp = points[5]
-        
-        # Middle finger tip and MCP  
-        middle_tip = points[12]
-        middle_mcp = points[9]
-        
-        # Thumb tip and MCP
-        thumb_tip = points[4]
-        thumb_mcp = points[2]
-        
-        # Check if fingers are extended
-        index_up = index_tip[1] < index_mcp[1]
-        middle_up = middle_tip[1] < middle_mcp[1]
-        thumb_up = thumb_tip[0] > thumb_mcp[0]  # Thumb extends horizontally
-        
-        # Gesture recognition
-        if index_up and not middle_up:
-            return "point"
-        elif index_up and middle_up:
-            return "peace"
-        elif thumb_up and index_up:
-            return "thumbs_up"
-        elif not index_up and not middle_up:
-            return "fist"
-        else:
-            return "open_hand"
+        # Simple gesture recognition based on finger positions of the first hand
+        return GESTURES[_gesture_code(landmarks[0])]
     
     def map_hand_to_cursor(self, landmarks):
         """Map hand position to cursor movement"""
@@ -156,11 +280,11 @@ class ComputerVision:
         
         # Map camera coordinates to screen coordinates
         # Flip X for mirror effect
-        screen_x = self.screen_width - int((index_tip[0] / 640) * self.screen_width)
-        screen_y = int((index_tip[1] / 480) * self.screen_height)
+        screen_x = self.screen_width - int(index_tip[0] * self._cam_to_screen_x)
+        screen_y = int(index_tip[1] * self._cam_to_screen_y)
         
-        # Smooth movement
-        current_x, current_y = pyautogui.position()
+        # Smooth movement against where we last put the cursor
+        current_x, current_y = self._last_cursor or (screen_x, screen_y)
         smooth_x = int(current_x * 0.7 + screen_x * 0.3)
         smooth_y = int(current_y * 0.7 + screen_y * 0.3)
         
@@ -198,17 +322,27 @@ class ComputerVision:
         if not self.camera_active:
             return False, "Camera not active"
             
+        grabber = self._grabber = FrameGrabber(self.camera).start()
+        self._prev_gray = None
+        self._last_landmarks = []
+        self._last_drawn = []
         try:
             while self.camera_active:
-                ret, frame = self.camera.read()
-                if not ret:
-                    break
+                # Always work on the most recent frame; stale ones are dropped
+                frame = grabber.read()
+                if frame is None:
+                    if grabber.stopped:
+                        break
+                    continue  # Camera slow to deliver (e.g. still warming up)
                 
                 # Flip frame horizontally for mirror effect
                 frame = cv2.flip(frame, 1)
                 
-                # Detect hands
-                frame, landmarks = self.detect_hands(frame)
+                # Detect hands, skipping inference while the scene is static
+                if self._frame_changed(frame):
+                    frame, landmarks = self.detect_hands(frame)
+                else:
+                    frame, landmarks = self.reuse_last_hands(frame)
                 
                 if landmarks:
                     # Recognize gesture
@@ -216,14 +350,14 @@ class ComputerVision:
                     
                     if gesture:
                         # Add to gesture buffer for stability
+                        if len(self.gesture_buffer) == self.gesture_buffer.maxlen:
+                            self.gesture_counts[self.gesture_buffer[0]] -= 1
                         self.gesture_buffer.append(gesture)
-                        if len(self.gesture_buffer) > self.gesture_threshold:
-                            self.gesture_buffer.pop(0)
+                        self.gesture_counts[gesture] += 1
                         
                         # Check if gesture is consistent
                         if len(self.gesture_buffer) >= 3:
-                            most_common = max(set(self.gesture_buffer), 
-                                            key=self.gesture_buffer.count)
+                            most_common = self.gesture_counts.most_common(1)[0][0]
                             
                             if most_common != self.last_gesture:
                                 action = self.execute_gesture_action(most_common)
@@ -231,6 +365,7 @@ class ComputerVision:
                                     cursor_pos = self.map_hand_to_cursor(landmarks)
                                     if cursor_pos:
                                         pyautogui.moveTo(cursor_pos[0], cursor_pos[1])
+                                        self._last_cursor = cursor_pos
                                 
                                 self.last_gesture = most_common
                 
@@ -246,6 +381,11 @@ class ComputerVision:
             
         except Exception as e:
             return False, f"Gesture control error: {e}"
+        finally:
+            grabber.stop()
+            self._grabber = None
+            # The loop is the only user of the models, so free them with it
+            self.release_hands()
     
     def start_gesture_control(self):
         """Start gesture control in background thread"""
@@ -264,21 +404,26 @@ class ComputerVision:
         """Analyze current screen content"""
         try:
             screenshot = pyautogui.screenshot()
-            # Convert to OpenCV format
-            frame = cv2.cvtColor(np.array(screenshot), cv2.COLOR_RGB2BGR)
+            # Edge detection only needs luminance, so go straight from RGB to gray
+            gray = cv2.cvtColor(np.asarray(screenshot), cv2.COLOR_RGB2GRAY)
+            
+            # Elements we keep are large, so a downscaled copy loses nothing useful
+            scale = SCREEN_ANALYSIS_SCALE
+            small = cv2.resize(gray, (0, 0), fx=1 / scale, fy=1 / scale,
+                               interpolation=cv2.INTER_AREA)
             
             # Simple analysis - detect windows, text areas, etc.
-            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-            edges = cv2.Canny(gray, 50, 150)
+            edges = cv2.Canny(small, 50, 150)
             
             # Find contours (potential UI elements)
-            contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+            contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_TC89_L1)
             
             ui_elements = []
             for contour in contours:
-                area = cv2.contourArea(contour)
+                # Bounding box in full-resolution screen pixels
+                x, y, w, h = (v * scale for v in cv2.boundingRect(contour))
+                area = w * h
                 if area > 1000:  # Filter small elements
-                    x, y, w, h = cv2.boundingRect(contour)
                     ui_elements.append({
                         'x': x, 'y': y, 'width': w, 'height': h, 'area': area
                     })
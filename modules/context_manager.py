@@ -1,7 +1,21 @@
+import atexit
 import json
+import os
+import threading
+import time
 from pathlib import Path
 from datetime import datetime
 
+# orjson serializes the contexts file much faster than json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Mutations are coalesced and written at most once per interval (seconds)
+SAVE_INTERVAL = 2.0
+
 class ContextManager:
     def __init__(self, memory_system):
         self.memory = memory_system
@@ -13,13 +27,20 @@ class ContextManager:
         # Load existing contexts
         self.load_contexts()
         
+        # Background writer for pending changes
+        self._dirty = False
+        self._save_lock = threading.Lock()
+        threading.Thread(target=self._flush_loop, name="context-flush", daemon=True).start()
+        atexit.register(self.flush)
+        
     def load_contexts(self):
         """Load saved contexts from disk"""
         context_file = self.context_dir / "contexts.json"
         if context_file.exists():
             try:
-                with open(context_file, 'r') as f:
-                    self.contexts = json.load(f)
+                with open(context_file, 'rb') as f:
+                    data = f.read()
+                self.contexts = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
             except:
                 self.contexts = {}
         
@@ -36,8 +57,35 @@ class ContextManager:
     def save_contexts(self):
         """Save contexts to disk"""
         context_file = self.context_dir / "contexts.json"
-        with open(context_file, 'w') as f:
-            json.dump(self.contexts, f, indent=2)
+        # Per-process temp name so concurrent JARVIS instances don't clobber each other
+        tmp_file = context_file.with_name(f"contexts.json.{os.getpid()}.tmp")
+        with self._save_lock:
+            self._dirty = False
+            try:
+                if ORJSON_AVAILABLE:
+                    data = orjson.dumps(self.contexts)
+                else:
+                    data = json.dumps(self.contexts).encode()
+            except RuntimeError:
+                # Mutated mid-dump by another thread; retry on the next flush
+                self._dirty = True
+                return
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_file, context_file)
+    
+    def flush(self):
+        """Write pending changes now"""
+        if self._dirty:
+            self.save_contexts()
+    
+    def _flush_loop(self):
+        while True:
+            time.sleep(SAVE_INTERVAL)
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"Failed to save contexts: {e}")
     
     def create_context(self, name, description=""):
         """Create a new context"""
@@ -51,20 +99,21 @@ class ContextManager:
             "history": []
         }
         
-        self.save_contexts()
+        self._dirty = True
         self.memory.store_knowledge("contexts", context_id, name)
         return context_id
     
     def switch_context(self, context_id):
         """Switch to a different context"""
         if context_id in self.contexts:
-            # Save current context state
+            # Save current context state (epoch seconds; only used for ordering)
+            now = time.time()
             if self.active_context in self.contexts:
-                self.contexts[self.active_context]["last_accessed"] = datetime.now().isoformat()
+                self.contexts[self.active_context]["last_accessed"] = now
             
             self.active_context = context_id
-            self.contexts[context_id]["last_accessed"] = datetime.now().isoformat()
-            self.save_contexts()
+            self.contexts[context_id]["last_accessed"] = now
+            self._dirty = True
             return True
         return False
     
@@ -79,9 +128,9 @@ class ContextManager:
         if self.active_context in self.contexts:
             self.contexts[self.active_context]["variables"][key] = {
                 "value": value,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": time.time()
             }
-            self.save_contexts()
+            self._dirty = True
     
     def get_context_variable(self, key):
         """Get a variable from current context"""
@@ -96,7 +145,7 @@ class ContextManager:
             self.contexts[self.active_context]["history"].append({
                 "action": action,
                 "details": details,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": time.time()
             })
             
             # Keep only last 50 history items
@@ -104,7 +153,7 @@ class ContextManager:
                 self.contexts[self.active_context]["history"] = \
                     self.contexts[self.active_context]["history"][-50:]
             
-            self.save_contexts()
+            self._dirty = True
     
     def get_context_summary(self):
         """Get summary of current context"""
@@ -138,7 +187,7 @@ class ContextManager:
         
         if context_id in self.contexts:
             del self.contexts[context_id]
-            self.save_contexts()
+            self._dirty = True
             
             # Switch to general if deleting active context
             if self.active_context == context_id:
@@ -1,14 +1,136 @@
+import atexit
 import json
+import os
+import random
+import re
+import threading
 import time
+from collections import deque
+from itertools import islice
 from datetime import datetime
 from pathlib import Path
 
+# orjson serializes the history log much faster than json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# New exchanges are coalesced and written at most once per interval (seconds)
+SAVE_INTERVAL = 2.0
+
+# Exchanges are appended one JSON object per line; the log is rewritten down to
+# the newest HISTORY_LIMIT exchanges once COMPACT_EVERY lines have piled up
+HISTORY_FILE = Path('conversation_history.jsonl')
+LEGACY_HISTORY_FILE = Path('conversation_history.json')
+HISTORY_LIMIT = 50
+COMPACT_EVERY = 100
+
+def _word_alternation(words):
+    """Regex source matching any of the phrases as whole words"""
+    return r'\b(?:' + '|'.join(map(re.escape, words)) + r')\b'
+
+# Case-insensitive, so callers search the raw input without lowercasing it
+_RE_QUESTION = re.compile(_word_alternation(
+    ['what', 'how', 'why', 'when', 'where', 'who', 'which']), re.IGNORECASE)
+_RE_COMMAND_INDICATOR = re.compile(_word_alternation(
+    ['create', 'open', 'launch', 'kill', 'move', 'delete', 'find']), re.IGNORECASE)
+_RE_CONVERSATIONAL = re.compile(_word_alternation([
+    'tell me', 'what is', 'how are', 'who are', 'explain', 'describe',
+    'hello', 'hi', 'hey', 'thanks', 'thank you', 'good job',
+    'what can you', 'do you know', 'can you help', 'i need help',
+    'do you remember', 'what do you know about me'
+]), re.IGNORECASE)
+_RE_NAME_INTRODUCTION = re.compile(r'\bmy name is\b', re.IGNORECASE)
+
+# Memory questions. The alternatives are anchored lookaheads tried in priority
+# order, so lastgroup names the highest-priority phrase anywhere in the input;
+# 'trigger' alone means a memory cue that none of the specific answers cover
+_RE_MEMORY_QUERY = re.compile(
+    r'^(?:(?=.*?(?P<name>my name))'
+    r'|(?=.*?do you remember(?P<remember>))'
+    r'|(?=.*?(?P<about_me>what do you know about me))'
+    r'|(?=.*?(?P<trigger>remember|do you know)))',
+    re.IGNORECASE | re.DOTALL)
+
+def _dump_line(obj):
+    """Serialize obj as one compact, newline-terminated JSON line (bytes)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(obj, separators=(',', ':')).encode() + b'\n'
+
+def _loads(data):
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+# Conversation types answered by the language model rather than canned replies
+_AI_CONVERSATION_TYPES = frozenset({'question', 'general_conversation'})
+
+# Canned replies per conversation type; _CAPABILITIES_RESPONSE stands in for the
+# dynamic capabilities summary, which is only built when it is picked
+_CAPABILITIES_RESPONSE = object()
+
+_PERSONALITY_RESPONSES = {
+    'greetings': (
+        "Hello! JARVIS at your service. How may I assist you today?",
+        "Good to see you! I'm ready to help with whatever you need.",
+        "Greetings! All systems are online and ready for your commands."
+    ),
+    'questions_about_self': (
+        "I'm JARVIS, your advanced AI assistant. I can control your system, manage files, recognize gestures, create web projects, and have conversations like this one. Think of me as your digital companion for productivity and automation.",
+        "I'm an AI assistant inspired by Tony Stark's JARVIS. I specialize in system control, automation, and making your computing experience more intuitive through voice commands and gesture recognition.",
+        _CAPABILITIES_RESPONSE
+    ),
+    'status_inquiries': (
+        "I'm operating at full capacity! All systems are green and ready for action.",
+        "Functioning perfectly, thank you for asking. How can I make your day more productive?",
+        "All systems nominal. I'm here and ready to assist with whatever you need."
+    ),
+    'compliments': (
+        "Thank you! I do my best to be helpful. Is there anything else I can assist you with?",
+        "I appreciate that! It's my pleasure to serve. What shall we tackle next?",
+        "Much appreciated! I'm always striving to improve my assistance."
+    ),
+    'thanks': (
+        "You're very welcome! Happy to help anytime.",
+        "My pleasure! That's what I'm here for.",
+        "Glad I could assist! Feel free to ask if you need anything else."
+    )
+}
+
+# Static persona prompt; only the conversation context changes per turn
+_SYSTEM_PROMPT_TEMPLATE = """You are JARVIS, an advanced AI assistant inspired by Tony Stark's AI from Marvel. 
+
+Your personality:
+- Professional but friendly
+- Slightly witty and sophisticated
+- Knowledgeable about technology and systems
+- Helpful and proactive
+- Confident but not arrogant
+
+Your capabilities include:
+- System control and automation
+- File and application management
+- Computer vision and gesture recognition
+- Web development assistance
+- General knowledge and conversation
+- Long-term memory and learning
+
+You have access to persistent memory and can remember information about users between conversations.
+
+Keep responses concise but informative. Use a tone that's professional yet personable.
+
+Recent conversation context:
+{context}
+
+Respond as JARVIS would - helpful, intelligent, and with subtle personality."""
+
 class ConversationalAI:
     def __init__(self, ai_handler, feature_discovery=None):
         self.ai_handler = ai_handler
         self.feature_discovery = feature_discovery
         self.memory_system = None  # Will be set by JARVIS
-        self.conversation_history = []
+        self.conversation_history = deque(maxlen=HISTORY_LIMIT)  # Newest exchanges
         self.context_memory = {}
         self.personality_traits = {
             'name': 'JARVIS',
@@ -42,97 +164,138 @@ class ConversationalAI:
             ]
         }
         
+        # One pass over the input finds the first matching pattern; the
+        # named group says which category it belongs to
+        self._conversation_re = re.compile('|'.join(
+            f'(?P<{pattern_type}>{_word_alternation(patterns)})'
+            for pattern_type, patterns in self.conversation_patterns.items()),
+            re.IGNORECASE)
+        
+        # Background writer state: exchanges not yet on disk, lines in the log
+        # since the last rewrite, and whether the log needs a full rewrite
+        self._pending = deque()
+        self._logged = 0
+        self._rewrite = False
+        self._history_fp = None  # Long-lived append handle, reopened after a rewrite
+        self._save_lock = threading.Lock()
+        
         # Load conversation history if exists
         self.load_conversation_history()
+        
+        threading.Thread(target=self._flush_loop, name="conversation-flush", daemon=True).start()
+        atexit.register(self.flush)
     
     def save_conversation_history(self):
-        """Save conversation history to file"""
-        try:
-            history_file = Path('conversation_history.json')
-            with open(history_file, 'w') as f:
-                json.dump({
-                    'history': self.conversation_history[-50:],  # Keep last 50 exchanges
+        """Rewrite the log with the context and the most recent exchanges"""
+        with self._save_lock:
+            self._rewrite = False
+            # Everything pending now is covered by the history snapshot below
+            written = len(self._pending)
+            try:
+                tmp_file = HISTORY_FILE.with_name(f"{HISTORY_FILE.name}.{os.getpid()}.tmp")
+                lines = [_dump_line({
                     'context': self.context_memory,
                     'last_updated': datetime.now().isoformat()
-                }, f, indent=2)
-        except Exception as e:
-            print(f"Failed to save conversation history: {e}")
+                })]
+                lines.extend(_dump_line(entry) for entry in self.conversation_history)
+                with open(tmp_file, 'wb') as f:
+                    f.writelines(lines)
+                # The old handle points at the replaced file
+                if self._history_fp is not None:
+                    self._history_fp.close()
+                    self._history_fp = None
+                os.replace(tmp_file, HISTORY_FILE)
+                for _ in range(written):
+                    self._pending.popleft()
+                self._logged = len(lines) - 1
+            except RuntimeError:
+                # Mutated mid-dump by another thread; retry on the next flush
+                self._rewrite = True
+            except Exception as e:
+                print(f"Failed to save conversation history: {e}")
+    
+    def flush(self):
+        """Write pending exchanges now"""
+        if self._rewrite or self._logged + len(self._pending) > COMPACT_EVERY:
+            self.save_conversation_history()
+            return
+        if not self._pending:
+            return
+        with self._save_lock:
+            lines = []
+            while self._pending:
+                lines.append(_dump_line(self._pending.popleft()))
+            try:
+                if self._history_fp is None:
+                    self._history_fp = open(HISTORY_FILE, 'ab')
+                self._history_fp.writelines(lines)
+                self._history_fp.flush()
+                self._logged += len(lines)
+            except Exception as e:
+                print(f"Failed to save conversation history: {e}")
+    
+    def _flush_loop(self):
+        while True:
+            time.sleep(SAVE_INTERVAL)
+            self.flush()
     
     def load_conversation_history(self):
         """Load conversation history from file"""
         try:
-            history_file = Path('conversation_history.json')
-            if history_file.exists():
-                with open(history_file, 'r') as f:
-                    data = json.load(f)
-                    self.conversation_history = data.get('history', [])
+            if HISTORY_FILE.exists():
+                with open(HISTORY_FILE, 'rb') as f:
+                    for line in f:
+                        if not line.strip():
+                            continue
+                        entry = _loads(line)
+                        if 'context' in entry:
+                            self.context_memory = entry['context']
+                        else:
+                            self.conversation_history.append(entry)
+                            self._logged += 1
+            elif LEGACY_HISTORY_FILE.exists():
+                with open(LEGACY_HISTORY_FILE, 'rb') as f:
+                    data = _loads(f.read())
+                    self.conversation_history.extend(data.get('history', []))
                     self.context_memory = data.get('context', {})
+                # Carry it over into the append-only log on the first flush
+                self._rewrite = True
         except Exception as e:
             print(f"Failed to load conversation history: {e}")
     
     def add_to_conversation(self, user_input, jarvis_response):
         """Add exchange to conversation history"""
         self.conversation_history.append({
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': time.time(),
             'user': user_input,
             'jarvis': jarvis_response
         })
-        self.save_conversation_history()
+        self._pending.append(self.conversation_history[-1])
     
     def detect_conversation_type(self, user_input):
         """Detect what type of conversation this is"""
-        user_input_lower = user_input.lower()
-        
-        for pattern_type, patterns in self.conversation_patterns.items():
-            for pattern in patterns:
-                if pattern in user_input_lower:
-                    return pattern_type
+        match = self._conversation_re.search(user_input)
+        if match:
+            return match.lastgroup
         
         # Check for questions
-        question_words = ['what', 'how', 'why', 'when', 'where', 'who', 'which']
-        if any(word in user_input_lower for word in question_words):
+        if _RE_QUESTION.search(user_input):
             return 'question'
         
         # Check for commands vs conversation
-        command_indicators = ['create', 'open', 'launch', 'kill', 'move', 'delete', 'find']
-        if any(word in user_input_lower for word in command_indicators):
+        if _RE_COMMAND_INDICATOR.search(user_input):
             return 'command'
         
         return 'general_conversation'
     
     def generate_personality_response(self, conversation_type, user_input):
         """Generate personality-driven responses"""
-        responses = {
-            'greetings': [
-                "Hello! JARVIS at your service. How may I assist you today?",
-                "Good to see you! I'm ready to help with whatever you need.",
-                "Greetings! All systems are online and ready for your commands."
-            ],
-            'questions_about_self': [
-                "I'm JARVIS, your advanced AI assistant. I can control your system, manage files, recognize gestures, create web projects, and have conversations like this one. Think of me as your digital companion for productivity and automation.",
-                "I'm an AI assistant inspired by Tony Stark's JARVIS. I specialize in system control, automation, and making your computing experience more intuitive through voice commands and gesture recognition.",
-                self.get_capabilities_response()
-            ],
-            'status_inquiries': [
-                "I'm operating at full capacity! All systems are green and ready for action.",
-                "Functioning perfectly, thank you for asking. How can I make your day more productive?",
-                "All systems nominal. I'm here and ready to assist with whatever you need."
-            ],
-            'compliments': [
-                "Thank you! I do my best to be helpful. Is there anything else I can assist you with?",
-                "I appreciate that! It's my pleasure to serve. What shall we tackle next?",
-                "Much appreciated! I'm always striving to improve my assistance."
-            ],
-            'thanks': [
-                "You're very welcome! Happy to help anytime.",
-                "My pleasure! That's what I'm here for.",
-                "Glad I could assist! Feel free to ask if you need anything else."
-            ]
-        }
-        
-        if conversation_type in responses:
-            import random
-            return random.choice(responses[conversation_type])
+        choices = _PERSONALITY_RESPONSES.get(conversation_type)
+        if choices:
+            response = random.choice(choices)
+            if response is _CAPABILITIES_RESPONSE:
+                return self.get_capabilities_response()
+            return response
         
         return None
     
@@ -141,8 +304,9 @@ class ConversationalAI:
         conversation_type = self.detect_conversation_type(user_input)
         
         # Check memory first for personal questions
-        if self.memory_system and ("remember" in user_input.lower() or "my name" in user_input.lower() or "do you know" in user_input.lower()):
-            memory_response = self.check_memory_for_response(user_input)
+        memory_match = _RE_MEMORY_QUERY.search(user_input)
+        if self.memory_system and memory_match:
+            memory_response = self.check_memory_for_response(user_input, memory_match)
             if memory_response:
                 self.add_to_conversation(user_input, memory_response)
                 return True, memory_response
@@ -154,7 +318,7 @@ class ConversationalAI:
             return True, personality_response
         
         # For questions and general conversation, use AI
-        if conversation_type in ['question', 'general_conversation']:
+        if conversation_type in _AI_CONVERSATION_TYPES:
             return self.generate_ai_response(user_input)
         
         return False, "I'm not sure how to respond to that."
@@ -165,45 +329,20 @@ class ConversationalAI:
             return False, "AI conversation not available - no API key configured"
         
         # Build context from recent conversation and memory
-        context = ""
-        if self.conversation_history:
-            recent_history = self.conversation_history[-3:]  # Last 3 exchanges
-            for exchange in recent_history:
-                context += f"User: {exchange['user']}\nJARVIS: {exchange['jarvis']}\n"
+        # Last 3 exchanges, read from the newest end of the deque
+        recent_history = list(islice(reversed(self.conversation_history), 3))[::-1]
+        parts = [f"User: {exchange['user']}\nJARVIS: {exchange['jarvis']}\n"
+                 for exchange in recent_history]
         
         # Add memory context if available
         if self.memory_system:
             user_info = self.memory_system.recall_knowledge("user_info")
             if user_info:
-                context += "\nWhat I know about the user:\n"
-                for key, value in user_info.items():
-                    context += f"- {key}: {value}\n"
+                parts.append("\nWhat I know about the user:\n")
+                parts.extend(f"- {key}: {value}\n" for key, value in user_info.items())
         
-        system_prompt = f"""You are JARVIS, an advanced AI assistant inspired by Tony Stark's AI from Marvel. 
-
-Your personality:
-- Professional but friendly
-- Slightly witty and sophisticated
-- Knowledgeable about technology and systems
-- Helpful and proactive
-- Confident but not arrogant
-
-Your capabilities include:
-- System control and automation
-- File and application management
-- Computer vision and gesture recognition
-- Web development assistance
-- General knowledge and conversation
-- Long-term memory and learning
-
-You have access to persistent memory and can remember information about users between conversations.
-
-Keep responses concise but informative. Use a tone that's professional yet personable.
-
-Recent conversation context:
-{context}
-
-Respond as JARVIS would - helpful, intelligent, and with subtle personality."""
+        context = "".join(parts)
+        system_prompt = _SYSTEM_PROMPT_TEMPLATE.format(context=context)
 
         try:
             response = self.ai_handler.client.chat.completions.create(
@@ -234,7 +373,7 @@ Respond as JARVIS would - helpful, intelligent, and with subtle personality."""
     
     def clear_conversation_history(self):
         """Clear conversation history"""
-        self.conversation_history = []
+        self.conversation_history.clear()
         self.context_memory = {}
         self.save_conversation_history()
         return "Conversation history cleared."
@@ -242,18 +381,10 @@ Respond as JARVIS would - helpful, intelligent, and with subtle personality."""
     def is_conversational_input(self, user_input):
         """Check if input is conversational rather than a command"""
         # Don't handle name introductions - let memory system handle them
-        if "my name is" in user_input.lower():
+        if _RE_NAME_INTRODUCTION.search(user_input):
             return False
-            
-        conversation_indicators = [
-            'tell me', 'what is', 'how are', 'who are', 'explain', 'describe',
-            'hello', 'hi', 'hey', 'thanks', 'thank you', 'good job',
-            'what can you', 'do you know', 'can you help', 'i need help',
-            'do you remember', 'what do you know about me'
-        ]
         
-        user_input_lower = user_input.lower()
-        return any(indicator in user_input_lower for indicator in conversation_indicators)
+        return _RE_CONVERSATIONAL.search(user_input) is not None
     
     def get_capabilities_response(self):
         """Get dynamic capabilities response"""
@@ -263,15 +394,17 @@ Respond as JARVIS would - helpful, intelligent, and with subtle personality."""
         else:
             return "I'm JARVIS, your advanced AI assistant with system control, web development, memory, and automation capabilities."
     
-    def check_memory_for_response(self, user_input):
+    def check_memory_for_response(self, user_input, match=None):
         """Check memory system for relevant information"""
         if not self.memory_system:
             return None
-            
-        user_input_lower = user_input.lower()
+        
+        if match is None:
+            match = _RE_MEMORY_QUERY.search(user_input)
+        query_type = match.lastgroup if match else None
         
         # Check for name-related queries
-        if "my name" in user_input_lower or "do you remember my name" in user_input_lower:
+        if query_type == "name":
             name = self.memory_system.recall_knowledge("user_info", "name")
             if name:
                 return f"Yes, I remember your name is {name}."
@@ -279,20 +412,18 @@ Respond as JARVIS would - helpful, intelligent, and with subtle personality."""
                 return "I don't have your name stored in my memory yet. You can tell me your name and I'll remember it."
         
         # Check for general memory queries
-        if "do you remember" in user_input_lower:
+        if query_type == "remember":
             # Extract what they're asking about
-            parts = user_input_lower.split("do you remember")
-            if len(parts) > 1:
-                query = parts[1].strip()
-                # Search interactions for relevant information
-                results = self.memory_system.search_interactions(query, limit=3)
-                if results:
-                    return f"Yes, I remember we discussed {query}. I found {len(results)} related interactions in my memory."
-                else:
-                    return f"I don't have any specific memories about {query} in my records."
+            query = user_input[match.end("remember"):].strip().lower()
+            # Search interactions for relevant information
+            results = self.memory_system.search_interactions(query, limit=3)
+            if results:
+                return f"Yes, I remember we discussed {query}. I found {len(results)} related interactions in my memory."
+            else:
+                return f"I don't have any specific memories about {query} in my records."
         
         # Check for stored knowledge
-        if "what do you know about me" in user_input_lower:
+        if query_type == "about_me":
             user_info = self.memory_system.recall_knowledge("user_info")
             if user_info:
                 info_list = [f"{key}: {value}" for key, value in user_info.items()]
@@ -1,8 +1,55 @@
 import traceback
 import logging
+import mmap
+import re
+import time
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 
+_now_iso_cache = [0, ""]
+
+def _now_iso():
+    """Current time as an ISO string at second resolution, formatted once per second"""
+    now = int(time.time())
+    if now != _now_iso_cache[0]:
+        _now_iso_cache[1] = datetime.fromtimestamp(now).isoformat(timespec="seconds")
+        _now_iso_cache[0] = now
+    return _now_iso_cache[1]
+
+# Error type of a log line: the text between " - ERROR - " and the first colon
+_RE_ERROR_TYPE = re.compile(r' - ERROR - ([^:\n]*)')
+
+# Bytes scanned per slice when counting log lines
+_COUNT_CHUNK = 1 << 20
+
+def _read_log_tail(path, count):
+    """Return (total line count, last `count` lines) without reading the file into memory"""
+    with open(path, 'rb') as f:
+        size = f.seek(0, 2)
+        if size == 0:
+            return 0, []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # A final line without a newline still counts as a line
+            trailing_newline = mm[size - 1:size] == b'\n'
+            total = sum(mm[i:i + _COUNT_CHUNK].count(b'\n')
+                        for i in range(0, size, _COUNT_CHUNK))
+            if not trailing_newline:
+                total += 1
+            
+            # Walk back from the end to the newline preceding the last `count` lines
+            start = size - 1 if trailing_newline else size
+            for _ in range(count):
+                i = mm.rfind(b'\n', 0, start)
+                if i < 0:
+                    start = 0
+                    break
+                start = i
+            else:
+                start += 1
+            tail = mm[start:size]
+    return total, tail.decode('utf-8', errors='replace').splitlines(keepends=True)
+
 class ErrorHandler:
     def __init__(self, jarvis_instance):
         self.jarvis = jarvis_instance
@@ -34,7 +81,7 @@ class ErrorHandler:
         """Main error handling function"""
         error_type = type(error).__name__
         error_message = str(error)
-        timestamp = datetime.now().isoformat()
+        timestamp = _now_iso()
         
         # Log the error
         error_info = {
@@ -57,7 +104,7 @@ class ErrorHandler:
                     return recovery_result
             except Exception as recovery_error:
                 self.log_error({
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": _now_iso(),
                     "error_type": "RecoveryError",
                     "error_message": f"Recovery failed: {str(recovery_error)}",
                     "original_error": error_type,
@@ -199,23 +246,15 @@ class ErrorHandler:
     def get_error_statistics(self):
         """Get error statistics"""
         try:
-            with open(self.error_log_file, 'r') as f:
-                lines = f.readlines()
-            
-            error_counts = {}
-            recent_errors = []
+            total_lines, tail = _read_log_tail(self.error_log_file, 50)
             
-            for line in lines[-50:]:  # Last 50 errors
-                if " - ERROR - " in line:
-                    parts = line.split(" - ERROR - ")
-                    if len(parts) > 1:
-                        error_part = parts[1].split(":")[0]
-                        error_counts[error_part] = error_counts.get(error_part, 0) + 1
-                        recent_errors.append(line.strip())
+            # Last 50 errors
+            error_counts = Counter(_RE_ERROR_TYPE.findall("".join(tail)))
+            recent_errors = [line.strip() for line in tail if " - ERROR - " in line]
             
             return {
-                "total_errors": len(lines),
-                "error_types": error_counts,
+                "total_errors": total_lines,
+                "error_types": dict(error_counts),
                 "recent_errors": recent_errors[-10:]  # Last 10 errors
             }
             